@@ -77,6 +77,13 @@ def _format_list_files(result_data: Any, arguments: Dict[str, Any]) -> str:
         files_count = sum(1 for item in result_data if isinstance(item, dict) and item.get('is_file', False))
         dirs_count = sum(1 for item in result_data if isinstance(item, dict) and item.get('is_dir', False))
         return f"Listed directory '{directory}': found {files_count} files and {dirs_count} directories ({count} total items)"
+    if isinstance(result_data, dict) and 'name' in result_data:
+        # Columnar listing: one list per field
+        count = len(result_data['name'])
+        directory = arguments.get('directory', arguments.get('path', '.'))
+        files_count = sum(result_data.get('is_file', ()))
+        dirs_count = sum(result_data.get('is_dir', ()))
+        return f"Listed directory '{directory}': found {files_count} files and {dirs_count} directories ({count} total items)"
     return f"Listed directory '{arguments.get('directory', '.')}'"
 
 
@@ -15,7 +15,11 @@ project_root = backend_dir.parent
 
 load_dotenv(backend_dir / ".env")
 
-sys.path.insert(0, str(project_root))
+# Only needed when run as a script (python main.py from backendMock/);
+# as an imported module the project root is already on the path
+if __name__ == "__main__" and str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
 from core.logger import logger
 
 from backendMock.utils import get_env_variable
@@ -4,21 +4,52 @@ Unified Logger for Backend Services
 Provides configurable logging with console and file output.
 Supports log levels, rotation, and environment-based configuration.
 """
+import atexit
 import inspect
 import os
+import queue
 import sys
+import time
 import logging
+import logging.handlers
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Define custom log levels
 SYSTEM_LEVEL = 25
 AGENT_LEVEL = 26
 logging.addLevelName(SYSTEM_LEVEL, "SYSTEM")
 logging.addLevelName(AGENT_LEVEL, "AGENT")
 
+# Method name -> numeric level, resolved once instead of per call
+_LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'system': SYSTEM_LEVEL,
+    'agent': AGENT_LEVEL,
+    'warning': logging.WARNING,
+    'warn': logging.WARNING,
+    'error': logging.ERROR,
+    'critical': logging.CRITICAL,
+    'fatal': logging.CRITICAL,
+}
+
+# Compact JSON encoder for log payloads, chosen once at import: orjson
+# when installed, the standard library otherwise
+if orjson is not None:
+    def _dumps(data: Any) -> str:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+else:
+    def _dumps(data: Any) -> str:
+        return json.dumps(data, separators=(',', ':'), default=str)
+
 
 def _get_main_script_directory() -> Path:
     """
@@ -42,14 +73,19 @@ class LogConfig:
             env = os.environ
 
         self.log_level = env.get('LOG_LEVEL', 'info').upper()
+        # Numeric level, resolved once (unknown names: INFO)
+        self.log_levelno = _LEVELS.get(self.log_level.lower(), logging.INFO)
         self.log_console = self._parse_boolean_string(env.get('LOG_CONSOLE', 'true'))
         self.log_file = self._parse_boolean_string(env.get('LOG_FILE', 'true'))
         self.log_system = self._parse_boolean_string(env.get('LOG_SYSTEM', 'true'))
         self.log_agent = self._parse_boolean_string(env.get('LOG_AGENT', 'true'))
 
-        # Use the main script's directory as the base for the default log path
-        default_log_dir = str(_get_main_script_directory() / 'Logs')
-        self.log_dir = env.get('LOG_DIR', default_log_dir)
+        # Use the main script's directory as the base for the default log
+        # path; the stack is only inspected when LOG_DIR is not set
+        if 'LOG_DIR' in env:
+            self.log_dir = env['LOG_DIR']
+        else:
+            self.log_dir = str(_get_main_script_directory() / 'Logs')
 
         self.max_log_size = int(env.get('LOG_MAX_SIZE', str(10 * 1024 * 1024)))
         self.max_log_files = int(env.get('LOG_MAX_FILES', '5'))
@@ -64,6 +100,80 @@ class LogConfig:
         return value.lower() in ('true', '1', 'yes')
 
 
+def _pretty_format(data: Any, indent_level: int = 1) -> str:
+    """Formats data recursively, preserving newlines in strings."""
+    indent_str = "  " * indent_level
+    
+    if isinstance(data, dict):
+        if not data:
+            return "{}"
+        lines = ["{"]
+        for key, value in data.items():
+            formatted_key = json.dumps(key)
+            formatted_value = _pretty_format(value, indent_level + 1)
+            lines.append(f"{indent_str}{formatted_key}: {formatted_value},")
+        
+        if len(lines) > 1 and lines[-1].endswith(","):
+            lines[-1] = lines[-1][:-1]
+            
+        lines.append("  " * (indent_level - 1) + "}")
+        return "\n".join(lines)
+    
+    elif isinstance(data, list):
+        if not data:
+            return "[]"
+        lines = ["["]
+        for item in data:
+            formatted_item = _pretty_format(item, indent_level + 1)
+            lines.append(f"{indent_str}{formatted_item},")
+        
+        if len(lines) > 1 and lines[-1].endswith(","):
+            lines[-1] = lines[-1][:-1]
+            
+        lines.append("  " * (indent_level - 1) + "]")
+        return "\n".join(lines)
+        
+    elif isinstance(data, str):
+        if '\n' in data:
+            replacement = "\n" + indent_str
+            return '"' + data.replace('\n', replacement) + '"'
+        return json.dumps(data)
+        
+    else:
+        try:
+            return json.dumps(data)
+        except (TypeError, ValueError):
+            return str(data)
+
+
+def _format_data(data: Any, compact: bool = False) -> str:
+    """
+    Renders a log payload as the text appended below the message.
+
+    Args:
+        data: Payload (string, dict, list, ...); falsy payloads render as ""
+        compact: Single-line JSON instead of the indented pretty format
+    """
+    if not data:
+        return ""
+    if isinstance(data, str):
+        return "\n  " + data.replace('\n', '\n  ')
+    if compact:
+        try:
+            return "\n  " + _dumps(data)
+        except (TypeError, ValueError):
+            return "\n  [Could not serialize data]"
+    try:
+        # Use custom pretty format instead of standard json.dumps
+        return f"\n  {_pretty_format(data)}"
+    except Exception:
+        # Fallback if something goes wrong
+        try:
+            return "\n  " + json.dumps(data, indent=2)
+        except TypeError:
+            return "\n  [Could not serialize data]"
+
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with optional color support."""
 
@@ -78,42 +188,56 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\x1b[0m'
     }
 
-    def __init__(self, use_colors: bool = True, *args, **kwargs):
+    def __init__(self, use_colors: bool = True, compact_data: bool = False, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.use_colors = use_colors and sys.stdout.isatty()
+        self.compact_data = compact_data
+        if self.use_colors:
+            self._level_styles = self._build_level_styles()
+        else:
+            # Plain output: no per-record level lookup at all
+            self.formatMessage = self._format_plain_message
+
+    def _build_level_styles(self) -> Dict[str, Tuple[logging.PercentStyle, str]]:
+        """
+        Precomputes one colored format, and the text closing it, per level.
+
+        SYSTEM and AGENT lines are colored whole (background color), other
+        levels only have their level name colored.
+        """
+        reset = self.COLORS['RESET']
+        styles = {}
+        for levelname, color in self.COLORS.items():
+            if levelname == 'RESET':
+                continue
+            if levelname in ('SYSTEM', 'AGENT'):
+                # Reset after the data payload, which belongs to the line
+                styles[levelname] = (logging.PercentStyle(f"{color}{self._fmt}"), reset)
+            else:
+                fmt = self._fmt.replace('%(levelname)s', f"{color}%(levelname)s{reset}")
+                styles[levelname] = (logging.PercentStyle(fmt), '')
+        return styles
 
     def formatTime(self, record, datefmt=None):
         """Formats the timestamp with milliseconds."""
-        ct = datetime.fromtimestamp(record.created)
-        if datefmt:
-            s = ct.strftime(datefmt)
-        else:
-            s = ct.strftime("%H:%M:%S")
+        s = time.strftime(datefmt or "%H:%M:%S", self.converter(record.created))
         return f"{s}.{int(record.msecs):03d}"
 
-    def format(self, record: logging.LogRecord) -> str:
-        """Formats the log record, adding color if enabled."""
-        no_color = getattr(record, 'no_color', False)
-        
-        if not self.use_colors or no_color:
-            return super().format(record)
+    def _render_data(self, record: logging.LogRecord) -> str:
+        """Renders the record's data payload, after level filtering."""
+        return _format_data(getattr(record, 'log_data', None), self.compact_data)
 
-        original_levelname = record.levelname
-        color = self.COLORS.get(original_levelname, self.COLORS['RESET'])
-        reset = self.COLORS['RESET']
-        
-        # For SYSTEM and AGENT, apply color (background) to the entire line
-        if original_levelname in ['SYSTEM', 'AGENT']:
-            formatted = super().format(record)
-            return f"{color}{formatted}{reset}"
-        else:
-            # For others, only color the level name
-            try:
-                record.levelname = f"{color}{original_levelname}{reset}"
-                return super().format(record)
-            finally:
-                # Restore original levelname to avoid side effects
-                record.levelname = original_levelname
+    def _format_plain_message(self, record: logging.LogRecord) -> str:
+        """Formats the log line and its data payload, without colors."""
+        return f"{self._style.format(record)}{self._render_data(record)}"
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Formats the log line and its data payload, colored per level."""
+        # The colored format is picked per level instead of rewriting
+        # record.levelname, so the record is never modified and other
+        # handlers see it unchanged
+        style, suffix = self._level_styles.get(record.levelname, (self._style, ''))
+        return f"{style.format(record)}{self._render_data(record)}{suffix}"
 
 
 class Logger:
@@ -123,7 +247,8 @@ class Logger:
     Methods accept (debug_id, message, data=None):
         - debug_id: A short identifier for the log source (e.g., 'API', 'DB').
         - message: The main log message.
-        - data: Optional dictionary for structured data.
+        - data: Optional dictionary for structured data, or a zero-argument
+          callable returning it (only evaluated if the level is enabled).
     """
     _instance = None
 
@@ -140,11 +265,14 @@ class Logger:
         self._initialized = True
 
         self.config = config or LogConfig()
+        self.level = self.config.log_levelno
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(self.config.log_level)
+        self.logger.setLevel(self.level)
         self.logger.propagate = False
         self.log_file_path: Optional[str] = None
 
+        # Drain and stop the writer thread of a previous configuration
+        self._stop_file_listener()
         self.logger.handlers.clear()
 
         if self.config.log_console:
@@ -164,8 +292,9 @@ class Logger:
     def _add_console_handler(self):
         """Configures and adds a console handler to the logger."""
         handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(self.config.log_level)
+        handler.setLevel(self.level)
         formatter = ColoredFormatter(
+            use_colors=not self.config.no_color,
             fmt='[%(asctime)s] [%(levelname)s] %(message)s',
             datefmt='%H:%M:%S'
         )
@@ -180,17 +309,29 @@ class Logger:
 
             timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
             log_file = log_dir / f'log-{timestamp}.log'
-            self.log_file_path = str(log_file)
 
-            handler = logging.FileHandler(log_file, mode='w', encoding='utf-8')
-            handler.setLevel(self.config.log_level)
+            # Records are formatted by the caller (so the data payload is
+            # captured as it is now) and only enqueued; a background thread
+            # writes them to disk
+            file_handler = logging.FileHandler(log_file, mode='w', encoding='utf-8')
+            file_handler.setFormatter(logging.Formatter('%(message)s'))
+
+            handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+            handler.setLevel(self.level)
             formatter = ColoredFormatter(
                 use_colors=False,
+                compact_data=True,
                 fmt='[%(asctime)s] [%(levelname)s] %(message)s',
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
             handler.setFormatter(formatter)
+
+            self._file_listener = logging.handlers.QueueListener(handler.queue, file_handler)
+            self._file_listener.start()
             self.logger.addHandler(handler)
+            # Recorded once the file is actually open, so get_log_path never
+            # reports a file that failed to open
+            self.log_file_path = str(log_file)
             print(f"[LOGGER] Logging to: {self.log_file_path}")
 
             # Enforce log rotation
@@ -199,6 +340,16 @@ class Logger:
         except Exception as e:
             print(f"[LOGGER] Failed to setup file handler: {e}", file=sys.stderr)
 
+    def _stop_file_listener(self):
+        """Flushes queued file records and stops the writer thread, if any."""
+        listener = getattr(self, '_file_listener', None)
+        if listener is None:
+            return
+        self._file_listener = None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
     def _rotate_logs(self, log_dir: Path):
         """Deletes oldest log files if the count exceeds the max_log_files limit."""
         try:
@@ -212,125 +363,71 @@ class Logger:
         except Exception as e:
              self.logger.error(f"[LOGGER] Failed to rotate logs: {e}")
 
-    def _pretty_format(self, data: Any, indent_level: int = 1) -> str:
-        """Formats data recursively, preserving newlines in strings."""
-        indent_str = "  " * indent_level
-        
-        if isinstance(data, dict):
-            if not data:
-                return "{}"
-            lines = ["{"]
-            for key, value in data.items():
-                formatted_key = json.dumps(key)
-                formatted_value = self._pretty_format(value, indent_level + 1)
-                lines.append(f"{indent_str}{formatted_key}: {formatted_value},")
-            
-            if len(lines) > 1 and lines[-1].endswith(","):
-                lines[-1] = lines[-1][:-1]
-                
-            lines.append("  " * (indent_level - 1) + "}")
-            return "\n".join(lines)
-        
-        elif isinstance(data, list):
-            if not data:
-                return "[]"
-            lines = ["["]
-            for item in data:
-                formatted_item = self._pretty_format(item, indent_level + 1)
-                lines.append(f"{indent_str}{formatted_item},")
-            
-            if len(lines) > 1 and lines[-1].endswith(","):
-                lines[-1] = lines[-1][:-1]
-                
-            lines.append("  " * (indent_level - 1) + "]")
-            return "\n".join(lines)
-            
-        elif isinstance(data, str):
-            if '\n' in data:
-                replacement = "\n" + indent_str
-                return '"' + data.replace('\n', replacement) + '"'
-            return json.dumps(data)
-            
-        else:
-            try:
-                return json.dumps(data)
-            except (TypeError, ValueError):
-                return str(data)
-
-    def _format_message(self, debug_id: str, message: str, data: Optional[Any] = None) -> str:
-        """Formats the log message with a debug ID and optional data."""
-        formatted_message = f"[{debug_id}] {message}"
-        if data:
-            if isinstance(data, str):
-                formatted_message += "\n  " + data.replace('\n', '\n  ')
-            else:
-                try:
-                    # Use custom pretty format instead of standard json.dumps
-                    data_str = self._pretty_format(data)
-                    formatted_message += f"\n  {data_str}"
-                except Exception:
-                    # Fallback if something goes wrong
-                    try:
-                        data_str = json.dumps(data, indent=2)
-                        formatted_message += f"\n  {data_str}"
-                    except TypeError:
-                        formatted_message += "\n  [Could not serialize data]"
-        return formatted_message
-
-    def _log(self, level: str, debug_id: str, message: str, data: Optional[Any] = None):
+    def _log(self, levelno: int, debug_id: str, message: str, data: Optional[Any] = None):
         """Private helper to handle all logging calls."""
-        # Handle custom levels
-        if level.upper() == 'SYSTEM':
-            log_method = lambda msg, **kwargs: self.logger.log(SYSTEM_LEVEL, msg, **kwargs)
-        elif level.upper() == 'AGENT':
-            log_method = lambda msg, **kwargs: self.logger.log(AGENT_LEVEL, msg, **kwargs)
-        else:
-            log_method = getattr(self.logger, level.lower(), self.logger.info)
-            
-        extra = {'no_color': self.config.no_color}
-        log_method(self._format_message(debug_id, message, data), extra=extra)
+        # Skip payload construction and formatting for filtered-out records
+        if not self.logger.isEnabledFor(levelno):
+            return
+
+        if callable(data):
+            data = data()
+
+        self.logger.log(levelno, f"[{debug_id}] {message}", extra={'log_data': data})
+
+    def is_enabled_for(self, level: str) -> bool:
+        """Returns True if records at the given level would be emitted."""
+        return self.logger.isEnabledFor(_LEVELS.get(level.lower(), logging.INFO))
+
+    @property
+    def debug_enabled(self) -> bool:
+        """True if debug records are emitted; use to guard costly debug payloads."""
+        return self.logger.isEnabledFor(logging.DEBUG)
 
     def debug(self, debug_id: str, message: str, data: Optional[Any] = None):
-        self._log('debug', debug_id, message, data)
+        self._log(logging.DEBUG, debug_id, message, data)
 
     def info(self, debug_id: str, message: str, data: Optional[Any] = None):
-        self._log('info', debug_id, message, data)
+        self._log(logging.INFO, debug_id, message, data)
 
     def system(self, debug_id: str, message: str, data: Optional[Any] = None):
         """Log at SYSTEM level if enabled."""
         if self.config.log_system:
-            self._log('system', debug_id, message, data)
+            self._log(SYSTEM_LEVEL, debug_id, message, data)
 
     def agent(self, debug_id: str, message: str, data: Optional[Any] = None):
         """Log at AGENT level if enabled."""
         if self.config.log_agent:
-            self._log('agent', debug_id, message, data)
+            self._log(AGENT_LEVEL, debug_id, message, data)
 
     def warning(self, debug_id: str, message: str, data: Optional[Any] = None):
-        self._log('warning', debug_id, message, data)
+        self._log(logging.WARNING, debug_id, message, data)
 
     def error(self, debug_id: str, message: str, data: Optional[Any] = None):
-        self._log('error', debug_id, message, data)
+        self._log(logging.ERROR, debug_id, message, data)
 
     def critical(self, debug_id: str, message: str, data: Optional[Any] = None):
-        self._log('critical', debug_id, message, data)
+        self._log(logging.CRITICAL, debug_id, message, data)
 
     def separator(self, title: str = '', width: int = 80):
         if title:
+            # Odd padding puts the extra '=' on the right
             padding = max(0, width - len(title) - 4) // 2
-            line = '=' * padding + f' {title} ' + '=' * (padding + (width - len(title) - 4) % 2)
+            line = f"{'=' * padding} {title} ".ljust(width - 2, '=')
         else:
             line = '=' * width
-        self.logger.info(line, extra={'no_color': self.config.no_color})
+        self.logger.info(line)
 
     trace = debug
     warn = warning
     fatal = critical
 
     def get_log_path(self) -> Optional[str]:
+        """Returns the path of the open log file, or None without file logging."""
         return self.log_file_path
 
 logger = Logger()
+# Queued file records are written out before the interpreter exits
+atexit.register(lambda: logger._stop_file_listener())
 
 def log(level: str, debug_id: str, message: str, data: Optional[Any] = None):
     method = getattr(logger, level.lower(), logger.info)
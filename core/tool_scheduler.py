@@ -6,7 +6,7 @@ the agent's requests. It acts as an intermediary between the agent's reasoning
 loop and the tool registry.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import time
 
 from core.logger import logger
@@ -108,7 +108,7 @@ class ToolScheduler:
             
         return results
 
-    def _validate_and_coerce_args(self, args: Dict[str, Any], parameters: List[ToolParameter]) -> Dict[str, Any]:
+    def _validate_and_coerce_args(self, args: Dict[str, Any], parameters: Tuple[ToolParameter, ...]) -> Dict[str, Any]:
         """
         Validates and converts arguments according to the types defined in metadata.
         Handles frequent cases where LLMs send "true" (str) for bool, or "10" (str) for int.
@@ -65,6 +65,9 @@ class ResponseHandler:
         """
         logger.info("RESPONSE_HANDLER", "Request payload details")
 
+        if not logger.debug_enabled:
+            return
+
         for idx, msg in enumerate(messages):
             content = msg.get("content", "")
             content_preview = content[:200] if content else "[no content]"
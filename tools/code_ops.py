@@ -3,7 +3,9 @@ Code operations for agent system.
 """
 
 import ast
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -16,6 +18,9 @@ def check_syntax(file_path: str) -> str:
     """
     Checks the syntax of a Python file without executing it.
 
+    Results are cached per (path, mtime, size, inode), so re-checking an
+    unchanged file costs a single stat.
+
     Args:
         file_path: Path to the python file.
 
@@ -26,17 +31,51 @@ def check_syntax(file_path: str) -> str:
         FileNotFoundError: File does not exist
         CodeError: Failed to read or check file
     """
-    path = Path(file_path)
-
-    if not path.exists():
+    try:
+        st = os.stat(file_path)
+    except OSError:
         raise FileNotFoundError(f"File not found: {file_path}")
 
+    return _check_syntax_cached(file_path, st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+@lru_cache(maxsize=256)
+def _check_syntax_cached(
+    file_path: str,
+    mtime_ns: int,
+    size: int,
+    inode: int
+) -> str:
+    """
+    Parse a file and describe the outcome (memoized)
+
+    mtime_ns, size and inode are only part of the cache key. Failures
+    raise and are therefore never cached.
+
+    Args:
+        file_path: Path to the python file.
+        mtime_ns: Modification time of the file
+        size: Size of the file
+        inode: Inode number of the file
+
+    Returns:
+        "Syntax Valid." or syntax error description with line number.
+
+    Raises:
+        CodeError: Failed to read or check file
+    """
+    path = Path(file_path)
+
     try:
-        with open(path, 'r', encoding='utf-8') as f:
+        with open(path, 'rb') as f:
             source = f.read()
 
-        # AST Parsing
-        ast.parse(source)
+        # Blank files are trivially valid
+        if not source.strip():
+            return "Syntax Valid."
+
+        # AST Parsing (bytes: the parser decodes, honouring coding cookies)
+        ast.parse(source, filename=file_path)
         return "Syntax Valid."
     except SyntaxError as e:
         # Syntax errors are expected results, not tool failures
@@ -45,4 +84,3 @@ def check_syntax(file_path: str) -> str:
         raise CodeError(f"Permission denied: {file_path}")
     except Exception as e:
         raise CodeError(f"Failed to check syntax: {str(e)}")
-
@@ -4,11 +4,51 @@ File operations for agent system
 Provides basic file operations: read, write, edit, and metadata.
 """
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from threading import Lock
+from typing import Optional, Dict, Any, List, Tuple
+import asyncio
+import errno
+import mmap
 import os
-
-from core.logger import logger
+import shutil
+import stat
+import sys
+import tempfile
+import time
+
+
+# Whole-file reads are done with raw os.read; larger files are read in chunks
+_READ_CHUNK_SIZE = 4 * 1024 * 1024
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+
+# Large one-shot reads hint sequential readahead, then drop their pages so
+# scanning big files does not evict the small ones the agent keeps re-reading
+_FADVISE_THRESHOLD = 1024 * 1024
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+# Line-range reads of files this large go through mmap
+_MMAP_THRESHOLD = 1024 * 1024
+_HAS_MADVISE = hasattr(mmap, "MADV_SEQUENTIAL")
+
+# Short-lived stat cache: agents stat the same files repeatedly
+# (search, then read, then edit). Entries expire after the TTL to bound
+# staleness from external changes; our own writes invalidate explicitly.
+_STAT_CACHE_SIZE = 4096
+_STAT_CACHE_TTL = 1.0
+_stat_cache: "OrderedDict[str, Tuple[float, os.stat_result]]" = OrderedDict()
+_stat_cache_lock = Lock()
+
+# Shared pool for batch APIs; os.stat/os.read release the GIL, so
+# independent file operations overlap their syscall latency.
+# Worker threads are only started on first use.
+_io_pool = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix="file_ops"
+)
 
 
 class FileOperationError(Exception):
@@ -26,6 +66,82 @@ class FilePermissionError(FileOperationError):
     pass
 
 
+def _cached_stat(file_path: str) -> os.stat_result:
+    """
+    Stat a path through the bounded LRU/TTL cache
+
+    Args:
+        file_path: Path to stat
+
+    Returns:
+        os.stat_result (follows symlinks)
+
+    Raises:
+        OSError: Path cannot be stat'ed (failures are not cached)
+    """
+    key = os.path.abspath(file_path)
+    now = time.monotonic()
+
+    with _stat_cache_lock:
+        entry = _stat_cache.get(key)
+        if entry is not None and now - entry[0] < _STAT_CACHE_TTL:
+            _stat_cache.move_to_end(key)
+            return entry[1]
+
+    st = os.stat(key)
+
+    with _stat_cache_lock:
+        _stat_cache[key] = (now, st)
+        _stat_cache.move_to_end(key)
+        if len(_stat_cache) > _STAT_CACHE_SIZE:
+            _stat_cache.popitem(last=False)
+
+    return st
+
+
+def _invalidate_stat(*paths: str):
+    """
+    Drop cached stat entries for paths we are about to modify
+
+    Args:
+        *paths: Paths whose entries should be dropped
+    """
+    with _stat_cache_lock:
+        for path in paths:
+            _stat_cache.pop(os.path.abspath(path), None)
+
+
+def _worktree_changed(*paths: str):
+    """
+    Drop cached state for paths we are about to modify
+
+    Clears their stat entries and the cached git status results.
+
+    Args:
+        *paths: Paths whose stat entries should be dropped
+    """
+    _invalidate_stat(*paths)
+    _invalidate_git_status()
+
+
+def _invalidate_git_status():
+    """
+    Drop the cached git status results, if git_ops is loaded
+
+    git_ops is not imported here: it pulls in the logger, which file_ops
+    must not initialize. If it was never imported, nothing is cached.
+    """
+    git_ops = sys.modules.get("tools.git_ops")
+    if git_ops is not None:
+        git_ops.invalidate_status_cache()
+
+
+def _clear_stat_cache():
+    """Drop all cached stat entries (used after directory-level changes)"""
+    with _stat_cache_lock:
+        _stat_cache.clear()
+
+
 def read_file(
     file_path: str,
     offset: int = 0,
@@ -34,6 +150,10 @@ def read_file(
     """
     Read file contents with optional line range
 
+    Line ranges of files of 1 MiB or more decode only the selected
+    lines, so invalid UTF-8 outside the range raises no error there;
+    whole-file reads and smaller files fail on any undecodable byte.
+
     Args:
         file_path: Path to file
         offset: Line number to start from (0-indexed)
@@ -45,40 +165,197 @@ def read_file(
     Raises:
         FileNotFoundError: File does not exist
         FilePermissionError: No read permission
+        FileOperationError: Not a regular file, cannot be read or decoded
     """
-    path = Path(file_path)
-
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    try:
+        st = _cached_stat(file_path)
+    except PermissionError:
+        raise FilePermissionError(f"Permission denied: {file_path}")
+    except OSError as e:
+        if e.errno in (errno.ENOENT, errno.ENOTDIR):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        raise FileOperationError(f"Cannot read file {file_path}: {e}")
 
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise FileOperationError(f"Not a file: {file_path}")
 
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
-        # Apply offset and limit
-        if offset > 0:
-            lines = lines[offset:]
-
-        if limit is not None and limit > 0:
-            lines = lines[:limit]
-
-        content = ''.join(lines)
-        return content
+        fd = os.open(file_path, _READ_FLAGS)
+        try:
+            # Large file, line range requested: decode only the window
+            if st.st_size >= _MMAP_THRESHOLD and (offset > 0 or (limit or 0) > 0):
+                window = _read_lines_mmap(fd, offset, limit)
+                if window is not None:
+                    return window
+
+            advise = _HAS_FADVISE and st.st_size >= _FADVISE_THRESHOLD
+            if advise:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            data = _read_fd(fd, st.st_size)
+            if advise:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+        content = _decode_text(data)
+        return _slice_lines(content, offset, limit)
 
     except PermissionError:
         raise FilePermissionError(f"Permission denied: {file_path}")
 
+    except OSError as e:
+        _invalidate_stat(file_path)
+        if e.errno in (errno.ENOENT, errno.ENOTDIR):
+            # Removed since the (cached) stat
+            raise FileNotFoundError(f"File not found: {file_path}")
+        raise FileOperationError(f"Cannot read file {file_path}: {e}")
+
     except UnicodeDecodeError as e:
         raise FileOperationError(f"Cannot decode file: {file_path}")
 
 
+def _read_lines_mmap(fd: int, offset: int, limit: Optional[int]) -> Optional[str]:
+    """
+    Select a line range from a memory-mapped file
+
+    Newlines are located with mmap.find (memchr) and only the selected
+    byte window is decoded. Returns None when the caller must fall back
+    to a full read: the file is empty, or a carriage return appears
+    before the end of the window (universal-newline line counting
+    would then differ from splitting on \\n). Only the window is
+    decoded: invalid UTF-8 elsewhere in the file is intentionally not
+    reported, as validating it would cost the full decode this path
+    exists to avoid.
+
+    Args:
+        fd: Open file descriptor
+        offset: Line number to start from (0-indexed)
+        limit: Maximum number of lines (None or <= 0 for all)
+
+    Returns:
+        Selected lines, or None
+    """
+    try:
+        mm = mmap.mmap(fd, 0, prot=mmap.PROT_READ)
+    except (ValueError, OSError):
+        return None
+
+    try:
+        if _HAS_MADVISE:
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+
+        size = len(mm)
+        start = 0
+        for _ in range(offset):
+            index = mm.find(b'\n', start)
+            if index < 0:
+                start = size
+                break
+            start = index + 1
+
+        end = start
+        if limit is None or limit <= 0:
+            end = size
+        else:
+            for _ in range(limit):
+                index = mm.find(b'\n', end)
+                if index < 0:
+                    end = size
+                    break
+                end = index + 1
+
+        if mm.find(b'\r', 0, end) >= 0:
+            return None
+
+        return mm[start:end].decode('utf-8')
+    finally:
+        mm.close()
+
+
+def _read_fd(fd: int, size: int) -> bytes:
+    """
+    Read an open file descriptor to EOF
+
+    Files below the chunk size are read with a single os.read sized from
+    st_size (one extra byte detects growth since a possibly cached stat);
+    larger (or unsized, e.g. procfs) files are read in chunks into a
+    growing bytearray.
+
+    Args:
+        fd: Open file descriptor
+        size: Expected size from stat
+
+    Returns:
+        File contents as bytes
+    """
+    if 0 < size < _READ_CHUNK_SIZE:
+        data = os.read(fd, size + 1)
+        if len(data) <= size:
+            return data
+        buf = bytearray(data)
+    else:
+        buf = bytearray()
+
+    while True:
+        chunk = os.read(fd, _READ_CHUNK_SIZE)
+        if not chunk:
+            return buf
+        buf += chunk
+
+
+def _decode_text(data: bytes) -> str:
+    """
+    Decode UTF-8 bytes with universal newlines, like text-mode open()
+
+    Args:
+        data: Raw file contents
+
+    Returns:
+        Decoded text with \\r\\n and \\r translated to \\n
+    """
+    text = data.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _slice_lines(content: str, offset: int, limit: Optional[int]) -> str:
+    """
+    Select a line range, matching readlines()[offset:offset + limit]
+
+    Args:
+        content: Full text
+        offset: Line number to start from (0-indexed)
+        limit: Maximum number of lines (None or <= 0 for all)
+
+    Returns:
+        Selected lines, line endings preserved
+    """
+    start = 0
+    for _ in range(offset):
+        index = content.find('\n', start)
+        if index < 0:
+            return ''
+        start = index + 1
+
+    if limit is None or limit <= 0:
+        return content[start:] if start else content
+
+    end = start
+    for _ in range(limit):
+        index = content.find('\n', end)
+        if index < 0:
+            return content[start:]
+        end = index + 1
+
+    return content[start:end]
+
+
 def write_file(
     file_path: str,
     content: str,
-    create_dirs: bool = True
+    create_dirs: bool = True,
+    skip_if_unchanged: bool = True
 ) -> bool:
     """
     Write content to file (creates or overwrites)
@@ -87,6 +364,8 @@ def write_file(
         file_path: Path to file
         content: Content to write
         create_dirs: Create parent directories if needed
+        skip_if_unchanged: Leave the file (and its mtime) untouched if it
+            already holds exactly this content
 
     Returns:
         True if successful
@@ -95,15 +374,23 @@ def write_file(
         FilePermissionError: No write permission
         FileOperationError: Write failed
     """
-    path = Path(file_path)
-
     try:
-        # Create parent directories if needed
-        if create_dirs and not path.parent.exists():
-            path.parent.mkdir(parents=True, exist_ok=True)
-        # Write file
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        data = _encode_text(content)
+
+        # Idempotent rewrites (tool retries, re-serialisation) skip the write
+        if skip_if_unchanged and _content_matches(file_path, data):
+            return True
+
+        # Write file; parent directories are only looked at (and created)
+        # when the open fails because one is missing
+        try:
+            _write_bytes(file_path, data)
+        except OSError as e:
+            parent = os.path.dirname(file_path)
+            if e.errno != errno.ENOENT or not create_dirs or not parent:
+                raise
+            os.makedirs(parent, exist_ok=True)
+            _write_bytes(file_path, data)
         return True
 
     except PermissionError:
@@ -112,6 +399,115 @@ def write_file(
     except Exception as e:
         raise FileOperationError(f"Failed to write file: {e}")
 
+    finally:
+        _worktree_changed(file_path)
+
+
+def _encode_text(content: str) -> bytes:
+    """
+    Encode text the way a text-mode UTF-8 write would
+
+    Args:
+        content: Text to encode
+
+    Returns:
+        UTF-8 bytes with newlines translated to os.linesep
+    """
+    if os.linesep != '\n':
+        content = content.replace('\n', os.linesep)
+    return content.encode('utf-8')
+
+
+def _content_matches(file_path: str, data: bytes) -> bool:
+    """
+    Check whether a file already holds exactly the given bytes
+
+    Only reads the file when its size matches, so differing content is
+    usually rejected by the stat alone.
+
+    Args:
+        file_path: Path to file
+        data: Bytes about to be written
+
+    Returns:
+        True if the existing regular file is byte-identical
+    """
+    try:
+        st = _cached_stat(file_path)
+        if not stat.S_ISREG(st.st_mode) or st.st_size != len(data):
+            return False
+
+        fd = os.open(file_path, _READ_FLAGS)
+        try:
+            return _read_fd(fd, st.st_size) == data
+        finally:
+            os.close(fd)
+
+    except OSError:
+        return False
+
+
+def _write_bytes(file_path: str, data: bytes):
+    """
+    Write bytes with raw os.write calls
+
+    Equivalent to a text-mode open().write() of the decoded content but
+    skips the TextIOWrapper/BufferedWriter layers, which re-chunk and copy
+    the encoded data.
+
+    Args:
+        file_path: Path to file
+        data: Encoded content
+    """
+    data = memoryview(data)
+
+    fd = os.open(file_path, _WRITE_FLAGS, 0o666)
+    try:
+        while data:
+            written = os.write(fd, data)
+            data = data[written:]
+    finally:
+        os.close(fd)
+
+
+def _replace_bytes_atomic(file_path: str, data: bytes):
+    """
+    Replace an existing file's content atomically
+
+    The data is written to a temporary file in the same directory, given
+    the original permission bits and renamed over the target, so readers
+    (and a crash mid-write) see either the old or the new content, never
+    a truncated file. Symlinks are followed: the link target is replaced.
+
+    Args:
+        file_path: Path to an existing file
+        data: Encoded content
+    """
+    target = os.path.realpath(file_path)
+    mode = stat.S_IMODE(os.stat(target).st_mode)
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(target),
+        prefix=f".{os.path.basename(target)}.",
+        suffix=".tmp"
+    )
+    try:
+        view = memoryview(data)
+        try:
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 def edit_file(
     file_path: str,
@@ -145,21 +541,63 @@ def edit_file(
         with open(path, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        # Check if old_string exists
-        if old_string not in content:
+        new_content = _apply_edit(content, old_string, new_string, replace_all)
+        if new_content is None:
             raise FileOperationError(f"String not found in file: {file_path}")
 
-        # Replace
-        if replace_all:
-            new_content = content.replace(old_string, new_string)
-            count = content.count(old_string)
-        else:
-            new_content = content.replace(old_string, new_string, 1)
-            count = 1
+        # Write back (atomically: a failed write leaves the original)
+        _replace_bytes_atomic(file_path, _encode_text(new_content))
+        return True
+
+    except FileOperationError:
+        raise
+
+    except Exception as e:
+        raise FileOperationError(f"Failed to edit file: {e}")
+
+    finally:
+        _worktree_changed(file_path)
+
+
+def edit_file_many(
+    file_path: str,
+    edits: List[Tuple[str, str, bool]]
+) -> bool:
+    """
+    Apply several replacements to a file with one read and one write
+
+    Edits are applied in order, each to the result of the previous one.
+    If any old string is not found, nothing is written.
+
+    Args:
+        file_path: Path to file
+        edits: (old_string, new_string, replace_all) tuples
 
-        # Write back
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+    Returns:
+        True if replacements made
+
+    Raises:
+        FileNotFoundError: File does not exist
+        FileOperationError: String not found or edit failed
+    """
+    path = Path(file_path)
+
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        for number, (old_string, new_string, replace_all) in enumerate(edits, 1):
+            edited = _apply_edit(content, old_string, new_string, replace_all)
+            if edited is None:
+                raise FileOperationError(
+                    f"String not found in file: {file_path} (edit {number})"
+                )
+            content = edited
+
+        _replace_bytes_atomic(file_path, _encode_text(content))
         return True
 
     except FileOperationError:
@@ -168,6 +606,39 @@ def edit_file(
     except Exception as e:
         raise FileOperationError(f"Failed to edit file: {e}")
 
+    finally:
+        _worktree_changed(file_path)
+
+
+def _apply_edit(
+    content: str,
+    old_string: str,
+    new_string: str,
+    replace_all: bool
+) -> Optional[str]:
+    """
+    Replace the first (or every) occurrence of old_string in content
+
+    Args:
+        content: Text to edit
+        old_string: Text to find
+        new_string: Text to replace with
+        replace_all: Replace all occurrences
+
+    Returns:
+        Edited text, or None if old_string is empty or not found
+    """
+    # Locate the first occurrence once; it doubles as the existence check
+    index = content.find(old_string) if old_string else -1
+    if index < 0:
+        return None
+
+    # Splice around it; replace_all only rescans the remainder
+    tail = content[index + len(old_string):]
+    if replace_all:
+        tail = tail.replace(old_string, new_string)
+    return content[:index] + new_string + tail
+
 
 def file_exists(file_path: str) -> bool:
     """
@@ -179,9 +650,10 @@ def file_exists(file_path: str) -> bool:
     Returns:
         True if file exists and is a file
     """
-    path = Path(file_path)
-    exists = path.exists() and path.is_file()
-    return exists
+    try:
+        return stat.S_ISREG(_cached_stat(file_path).st_mode)
+    except OSError:
+        return False
 
 
 def get_file_info(file_path: str) -> Dict[str, Any]:
@@ -199,20 +671,24 @@ def get_file_info(file_path: str) -> Dict[str, Any]:
     """
     path = Path(file_path)
 
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-
     try:
-        stat = path.stat()
+        st = _cached_stat(file_path)
+    except PermissionError:
+        raise FilePermissionError(f"Permission denied: {file_path}")
+    except OSError as e:
+        if e.errno in (errno.ENOENT, errno.ENOTDIR):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        raise FileOperationError(f"Cannot read file {file_path}: {e}")
 
+    try:
         info = {
             "path": str(path.absolute()),
             "name": path.name,
-            "size": stat.st_size,
-            "is_file": path.is_file(),
-            "is_dir": path.is_dir(),
-            "modified": stat.st_mtime,
-            "created": stat.st_ctime,
+            "size": st.st_size,
+            "is_file": stat.S_ISREG(st.st_mode),
+            "is_dir": stat.S_ISDIR(st.st_mode),
+            "modified": st.st_mtime,
+            "created": st.st_ctime,
             "readable": os.access(path, os.R_OK),
             "writable": os.access(path, os.W_OK),
             "executable": os.access(path, os.X_OK)
@@ -223,6 +699,96 @@ def get_file_info(file_path: str) -> Dict[str, Any]:
         raise FileOperationError(f"Failed to get file info: {e}")
 
 
+def read_files_batch(
+    file_paths: List[str],
+    offset: int = 0,
+    limit: Optional[int] = None
+) -> List[str]:
+    """
+    Read several files concurrently
+
+    Args:
+        file_paths: Paths to read
+        offset: Line number to start from in each file (0-indexed)
+        limit: Maximum number of lines to read from each file
+
+    Returns:
+        File contents, in the same order as file_paths
+
+    Raises:
+        Same as read_file, for the first path that fails
+    """
+    return list(_io_pool.map(
+        lambda file_path: read_file(file_path, offset, limit),
+        file_paths
+    ))
+
+
+def write_files(
+    files: List[Tuple[str, str]],
+    create_dirs: bool = True
+) -> bool:
+    """
+    Write several files concurrently
+
+    If a path appears more than once, its last content is written.
+
+    Args:
+        files: (file_path, content) pairs
+        create_dirs: Create parent directories if needed
+
+    Returns:
+        True if all files were written
+
+    Raises:
+        Same as write_file, for the first path that fails
+    """
+    contents = dict(files)
+    list(_io_pool.map(
+        lambda item: write_file(item[0], item[1], create_dirs),
+        contents.items()
+    ))
+    return True
+
+
+def get_file_infos_batch(file_paths: List[str]) -> List[Dict[str, Any]]:
+    """
+    Get metadata for several files concurrently
+
+    Args:
+        file_paths: Paths to inspect
+
+    Returns:
+        File information dictionaries, in the same order as file_paths
+
+    Raises:
+        Same as get_file_info, for the first path that fails
+    """
+    return list(_io_pool.map(get_file_info, file_paths))
+
+
+async def get_file_infos_async(file_paths: List[str]) -> List[Dict[str, Any]]:
+    """
+    Get metadata for several files without blocking the event loop
+
+    The stats run concurrently on the shared I/O thread pool.
+
+    Args:
+        file_paths: Paths to inspect
+
+    Returns:
+        File information dictionaries, in the same order as file_paths
+
+    Raises:
+        Same as get_file_info, for the first path that fails
+    """
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(*(
+        loop.run_in_executor(_io_pool, get_file_info, file_path)
+        for file_path in file_paths
+    ))
+
+
 def delete_file(file_path: str) -> bool:
     """
     Delete file
@@ -252,6 +818,9 @@ def delete_file(file_path: str) -> bool:
     except Exception as e:
         raise FileOperationError(f"Failed to delete file: {e}")
 
+    finally:
+        _worktree_changed(file_path)
+
 
 def copy_file(source: str, destination: str) -> bool:
     """
@@ -268,8 +837,6 @@ def copy_file(source: str, destination: str) -> bool:
         FileNotFoundError: Source does not exist
         FileOperationError: Copy failed
     """
-    import shutil
-
     src_path = Path(source)
     dst_path = Path(destination)
 
@@ -283,6 +850,9 @@ def copy_file(source: str, destination: str) -> bool:
     except Exception as e:
         raise FileOperationError(f"Failed to copy file: {e}")
 
+    finally:
+        _worktree_changed(destination, os.path.join(destination, src_path.name))
+
 
 def move_path(src: str, dst: str) -> bool:
     """
@@ -299,8 +869,6 @@ def move_path(src: str, dst: str) -> bool:
         FileNotFoundError: Source does not exist
         FileOperationError: Move operation failed
     """
-    import shutil
-
     if not os.path.exists(src):
         raise FileNotFoundError(f"Source does not exist: {src}")
 
@@ -309,6 +877,10 @@ def move_path(src: str, dst: str) -> bool:
         return True
     except Exception as e:
         raise FileOperationError(f"Failed to move path: {e}")
+    finally:
+        # Directory moves can relocate many cached paths
+        _clear_stat_cache()
+        _invalidate_git_status()
 
 
 def delete_path(path: str, force: bool = False) -> bool:
@@ -326,8 +898,6 @@ def delete_path(path: str, force: bool = False) -> bool:
         FileNotFoundError: Path does not exist
         FileOperationError: Delete operation failed or security check failed
     """
-    import shutil
-
     if not os.path.exists(path):
         raise FileNotFoundError(f"Path does not exist: {path}")
 
@@ -347,3 +917,7 @@ def delete_path(path: str, force: bool = False) -> bool:
         raise
     except Exception as e:
         raise FileOperationError(f"Failed to delete path: {e}")
+    finally:
+        # Recursive deletes can remove many cached paths
+        _clear_stat_cache()
+        _invalidate_git_status()
@@ -4,12 +4,27 @@ Git operations for agent system
 Provides Git repository operations built on shell execution.
 """
 
-from typing import Optional, List
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Dict, Optional, List, Tuple, Union
+import os
+import time
 
 from tools.shell import run_command, CommandExecutionError
 from core.logger import logger
 
 
+# git status results are reused while the index and HEAD are unchanged.
+# Working tree edits do not touch either: file tools, bash commands and
+# repository operations clear the cache, and entries also expire after a
+# short TTL to cover edits made outside the tools.
+_STATUS_CACHE_SIZE = 32
+_STATUS_CACHE_TTL = 1.0
+_status_cache: "OrderedDict[Tuple, Tuple[float, str]]" = OrderedDict()
+_status_cache_lock = Lock()
+
+
 class GitError(Exception):
     """Base exception for Git errors"""
     pass
@@ -29,22 +44,190 @@ def is_git_repository(path: str = ".") -> bool:
     """
     Check if directory is a Git repository
 
+    Walks up from path looking for a .git entry (a directory, or a file
+    for worktrees and submodules) instead of forking git rev-parse.
+
     Args:
         path: Directory to check
 
     Returns:
         True if Git repository
     """
-    try:
-        result = run_command(
-            "git rev-parse --is-inside-work-tree",
-            cwd=path,
-            timeout=5
-        )
-        return result.success and result.stdout.strip() == "true"
-    except Exception:
+    current = os.path.abspath(path)
+    if not os.path.isdir(current):
         return False
 
+    while True:
+        if os.path.exists(os.path.join(current, ".git")):
+            return True
+        parent = os.path.dirname(current)
+        if parent == current:
+            return False
+        current = parent
+
+
+def _git_dir(path: str = ".") -> Optional[str]:
+    """
+    Locate the Git directory of the repository containing path
+
+    Args:
+        path: Directory inside the repository
+
+    Returns:
+        Absolute Git directory path, or None if not found
+    """
+    current = os.path.abspath(path)
+
+    while True:
+        dot_git = os.path.join(current, ".git")
+        if os.path.isdir(dot_git):
+            return dot_git
+
+        if os.path.isfile(dot_git):
+            # Worktrees and submodules: ".git" file with "gitdir: <path>"
+            try:
+                with open(dot_git, "r", encoding="utf-8") as f:
+                    content = f.read().strip()
+            except OSError:
+                return None
+            if not content.startswith("gitdir:"):
+                return None
+            return os.path.normpath(
+                os.path.join(current, content[len("gitdir:"):].strip())
+            )
+
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def _read_ref(git_dir: str, ref: str) -> Optional[str]:
+    """
+    Resolve a ref name to an object id without running git
+
+    Looks at loose refs (in the Git directory, then in the common
+    directory for worktrees) and then packed-refs.
+
+    Args:
+        git_dir: Git directory
+        ref: Full ref name (e.g. "refs/heads/main")
+
+    Returns:
+        Object id, or None if the ref cannot be resolved this way
+    """
+    common_dir = git_dir
+    try:
+        with open(os.path.join(git_dir, "commondir"), "r", encoding="utf-8") as f:
+            common_dir = os.path.normpath(os.path.join(git_dir, f.read().strip()))
+    except OSError:
+        pass
+
+    for base in (git_dir, common_dir):
+        try:
+            with open(os.path.join(base, ref), "r", encoding="utf-8") as f:
+                oid = f.read().strip()
+            if oid:
+                return oid
+        except OSError:
+            continue
+
+    try:
+        with open(os.path.join(common_dir, "packed-refs"), "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(("#", "^")):
+                    continue
+                oid, _, name = line.rstrip("\n").partition(" ")
+                if name == ref:
+                    return oid
+    except OSError:
+        pass
+
+    return None
+
+
+def _head_oid(path: str = ".") -> Optional[str]:
+    """
+    Resolve HEAD to a commit id by reading the Git directory directly
+
+    Args:
+        path: Repository path
+
+    Returns:
+        Commit id, or None if HEAD is unborn or cannot be read this way
+        (callers then fall back to git rev-parse)
+    """
+    git_dir = _git_dir(path)
+    if git_dir is None:
+        return None
+    return _read_head(git_dir)
+
+
+def _read_head(git_dir: str) -> Optional[str]:
+    """
+    Resolve HEAD of a Git directory to a commit id
+
+    Args:
+        git_dir: Git directory
+
+    Returns:
+        Commit id, or None if it cannot be read this way
+    """
+    try:
+        with open(os.path.join(git_dir, "HEAD"), "r", encoding="utf-8") as f:
+            head = f.read().strip()
+    except OSError:
+        return None
+
+    if head.startswith("ref:"):
+        return _read_ref(git_dir, head[len("ref:"):].strip())
+
+    return head or None
+
+
+def _status_cache_key(path: str, fmt: Union[bool, str]) -> Optional[Tuple]:
+    """
+    Build the git status cache key for a repository
+
+    Args:
+        path: Repository path
+        fmt: Output format (porcelain flag, or "v2")
+
+    Returns:
+        (realpath, format, index mtime, HEAD id), or None if the Git
+        directory cannot be located
+    """
+    git_dir = _git_dir(path)
+    if git_dir is None:
+        return None
+
+    try:
+        index_mtime = os.stat(os.path.join(git_dir, "index")).st_mtime_ns
+    except OSError:
+        index_mtime = None
+
+    return (os.path.realpath(path), fmt, index_mtime, _read_head(git_dir))
+
+
+def invalidate_status_cache():
+    """
+    Drop all cached git status results
+
+    Called after anything that may change the working tree (file tools,
+    bash commands), since such edits do not alter the cache key.
+    """
+    with _status_cache_lock:
+        _status_cache.clear()
+
+
+def _worktree_rewritten():
+    """Drop cached git status and file stats after git rewrote the working tree"""
+    # Imported here: file_ops notifies this module of its own writes
+    from tools.file_ops import _clear_stat_cache
+
+    invalidate_status_cache()
+    _clear_stat_cache()
+
 
 def git_init(path: str = ".") -> bool:
     """
@@ -60,13 +243,52 @@ def git_init(path: str = ".") -> bool:
         GitOperationError: Init failed
     """
     try:
-        result = run_command("git init", cwd=path, check=True)
+        result = run_command(["git", "init"], cwd=path, check=True)
         return True
 
     except CommandExecutionError as e:
         raise GitOperationError(f"Failed to initialize repository: {e}")
 
 
+def _run_status(path: str, fmt: Union[bool, str], cmd: List[str]) -> str:
+    """
+    Run a git status command, reusing a cached result when still valid
+
+    Args:
+        path: Repository path
+        fmt: Output format, part of the cache key
+        cmd: git status argv
+
+    Returns:
+        Status output
+
+    Raises:
+        CommandExecutionError: git status failed
+    """
+    key = _status_cache_key(path, fmt)
+    if key is not None:
+        now = time.monotonic()
+        with _status_cache_lock:
+            entry = _status_cache.get(key)
+            if entry is not None and now - entry[0] < _STATUS_CACHE_TTL:
+                _status_cache.move_to_end(key)
+                return entry[1]
+
+    result = run_command(cmd, cwd=path, check=True)
+
+    # git status may refresh the index (new mtime), so key the entry
+    # on the state after the command
+    key = _status_cache_key(path, fmt)
+    if key is not None:
+        with _status_cache_lock:
+            _status_cache[key] = (time.monotonic(), result.stdout)
+            _status_cache.move_to_end(key)
+            if len(_status_cache) > _STATUS_CACHE_SIZE:
+                _status_cache.popitem(last=False)
+
+    return result.stdout
+
+
 def git_status(path: str = ".", porcelain: bool = False) -> str:
     """
     Get Git status
@@ -86,13 +308,128 @@ def git_status(path: str = ".", porcelain: bool = False) -> str:
         raise GitNotRepositoryError(f"Not a Git repository: {path}")
 
     try:
-        cmd = "git status --porcelain" if porcelain else "git status"
-        result = run_command(cmd, cwd=path, check=True)
-        return result.stdout
+        cmd = ["git", "status", "--porcelain"] if porcelain else ["git", "status"]
+        return _run_status(path, porcelain, cmd)
+
+    except CommandExecutionError as e:
+        raise GitOperationError(f"Failed to get status: {e}")
+
+
+def git_status_entries(path: str = ".") -> Dict[str, Any]:
+    """
+    Get Git status as structured data
+
+    Runs git status --porcelain=v2 -z --branch (NUL-separated, so paths
+    need no unquoting) and parses the records.
+
+    Args:
+        path: Repository path
+
+    Returns:
+        Dictionary with "branch" (oid, head, upstream, ahead, behind),
+        "changed" (path, index, worktree, orig_path for renames),
+        "unmerged" (path, index, worktree), "untracked" and "ignored"
+        (paths)
+
+    Raises:
+        GitNotRepositoryError: Not a Git repository
+        GitOperationError: Status failed
+    """
+    if not is_git_repository(path):
+        raise GitNotRepositoryError(f"Not a Git repository: {path}")
+
+    try:
+        output = _run_status(
+            path,
+            "v2",
+            ["git", "status", "--porcelain=v2", "-z", "--branch"]
+        )
 
     except CommandExecutionError as e:
         raise GitOperationError(f"Failed to get status: {e}")
 
+    return _parse_status_v2(output)
+
+
+def _parse_status_v2(output: str) -> Dict[str, Any]:
+    """
+    Parse git status --porcelain=v2 -z --branch output
+
+    Args:
+        output: Raw command output
+
+    Returns:
+        Structured status (see git_status_entries)
+    """
+    status: Dict[str, Any] = {
+        "branch": {
+            "oid": None,
+            "head": None,
+            "upstream": None,
+            "ahead": 0,
+            "behind": 0
+        },
+        "changed": [],
+        "unmerged": [],
+        "untracked": [],
+        "ignored": []
+    }
+    branch = status["branch"]
+
+    records = iter(output.split("\0"))
+    for record in records:
+        if not record:
+            continue
+        kind = record[0]
+
+        if kind == "#":
+            _, _, header = record.partition(" ")
+            name, _, value = header.partition(" ")
+            if name == "branch.oid":
+                branch["oid"] = None if value == "(initial)" else value
+            elif name == "branch.head":
+                branch["head"] = None if value == "(detached)" else value
+            elif name == "branch.upstream":
+                branch["upstream"] = value
+            elif name == "branch.ab":
+                ahead, _, behind = value.partition(" ")
+                branch["ahead"] = int(ahead)
+                branch["behind"] = -int(behind)
+
+        elif kind == "1":
+            fields = record.split(" ", 8)
+            status["changed"].append({
+                "path": fields[8],
+                "index": fields[1][0],
+                "worktree": fields[1][1]
+            })
+
+        elif kind == "2":
+            fields = record.split(" ", 9)
+            status["changed"].append({
+                "path": fields[9],
+                "index": fields[1][0],
+                "worktree": fields[1][1],
+                # -z puts the original path in the next record
+                "orig_path": next(records, "")
+            })
+
+        elif kind == "u":
+            fields = record.split(" ", 10)
+            status["unmerged"].append({
+                "path": fields[10],
+                "index": fields[1][0],
+                "worktree": fields[1][1]
+            })
+
+        elif kind == "?":
+            status["untracked"].append(record[2:])
+
+        elif kind == "!":
+            status["ignored"].append(record[2:])
+
+    return status
+
 
 def git_add(
     files: List[str],
@@ -119,11 +456,9 @@ def git_add(
 
     try:
         if all_files:
-            cmd = "git add -A"
+            cmd = ["git", "add", "-A"]
         else:
-            # Quote filenames for safety
-            file_args = " ".join(f"'{f}'" for f in files)
-            cmd = f"git add {file_args}"
+            cmd = ["git", "add", "--", *files]
 
         result = run_command(cmd, cwd=path, check=True)
         return True
@@ -131,6 +466,9 @@ def git_add(
     except CommandExecutionError as e:
         raise GitOperationError(f"Failed to stage files: {e}")
 
+    finally:
+        invalidate_status_cache()
+
 
 def git_commit(
     message: str,
@@ -156,24 +494,26 @@ def git_commit(
         raise GitNotRepositoryError(f"Not a Git repository: {path}")
 
     try:
-        # Escape message for shell
-        escaped_msg = message.replace("'", "'\\''")
-        cmd = f"git commit -m '{escaped_msg}'"
+        cmd = ["git", "commit", "-m", message]
 
         if author:
-            escaped_author = author.replace("'", "'\\''")
-            cmd += f" --author '{escaped_author}'"
+            cmd += ["--author", author]
 
         result = run_command(cmd, cwd=path, check=True)
 
-        # Extract commit hash
-        hash_result = run_command("git rev-parse HEAD", cwd=path, check=True)
-        commit_hash = hash_result.stdout.strip()
+        # Extract commit hash, reading the ref directly when possible
+        commit_hash = _head_oid(path)
+        if commit_hash is None:
+            hash_result = run_command(["git", "rev-parse", "HEAD"], cwd=path, check=True)
+            commit_hash = hash_result.stdout.strip()
         return commit_hash
 
     except CommandExecutionError as e:
         raise GitOperationError(f"Failed to create commit: {e}")
 
+    finally:
+        invalidate_status_cache()
+
 
 def git_diff(
     path: str = ".",
@@ -198,11 +538,10 @@ def git_diff(
         raise GitNotRepositoryError(f"Not a Git repository: {path}")
 
     try:
-        cmd = "git diff --cached" if staged else "git diff"
+        cmd = ["git", "diff", "--cached"] if staged else ["git", "diff"]
 
         if files:
-            file_args = " ".join(f"'{f}'" for f in files)
-            cmd += f" -- {file_args}"
+            cmd += ["--", *files]
 
         result = run_command(cmd, cwd=path, check=True)
         return result.stdout
@@ -211,6 +550,133 @@ def git_diff(
         raise GitOperationError(f"Failed to get diff: {e}")
 
 
+def git_diff_entries(
+    path: str = ".",
+    staged: bool = False,
+    files: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Get diff as structured data
+
+    Args:
+        path: Repository path
+        staged: Show staged changes
+        files: Specific files to diff
+
+    Returns:
+        One dictionary per changed file: "path", "old_path", "status"
+        (A, D, M or R), "binary" and "hunks" (old_start, old_lines,
+        new_start, new_lines, header, lines)
+
+    Raises:
+        GitNotRepositoryError: Not a Git repository
+        GitOperationError: Diff failed
+    """
+    if not is_git_repository(path):
+        raise GitNotRepositoryError(f"Not a Git repository: {path}")
+
+    try:
+        # Stable, unquoted output regardless of user configuration: the
+        # a/ b/ prefixes are pinned (diff.noprefix, diff.mnemonicPrefix)
+        # and paths are repository-relative (diff.relative), as
+        # _parse_diff expects
+        cmd = [
+            "git", "-c", "core.quotePath=false",
+            "diff", "--no-color", "--no-ext-diff", "--no-relative",
+            "--src-prefix=a/", "--dst-prefix=b/"
+        ]
+        if staged:
+            cmd.append("--cached")
+        if files:
+            cmd += ["--", *files]
+
+        result = run_command(cmd, cwd=path, check=True)
+
+    except CommandExecutionError as e:
+        raise GitOperationError(f"Failed to get diff: {e}")
+
+    return _parse_diff(result.stdout)
+
+
+def _parse_diff(output: str) -> List[Dict[str, Any]]:
+    """
+    Parse unified git diff output
+
+    Args:
+        output: Raw git diff output
+
+    Returns:
+        Structured diff (see git_diff_entries)
+    """
+    entries: List[Dict[str, Any]] = []
+    entry: Optional[Dict[str, Any]] = None
+    hunk: Optional[Dict[str, Any]] = None
+
+    # Split on \n only: splitlines() would also break content lines at
+    # form feeds, vertical tabs and other Unicode line boundaries
+    lines = output.split("\n")
+    if lines and not lines[-1]:
+        lines.pop()
+
+    for line in lines:
+        if line.startswith("diff --git "):
+            # "a/<path> b/<path>"; only reliable when both paths are equal,
+            # later header lines override it otherwise
+            names = line[len("diff --git "):]
+            name = names[(len(names) + 5) // 2:] if len(names) % 2 else names
+            entry = {
+                "path": name,
+                "old_path": name,
+                "status": "M",
+                "binary": False,
+                "hunks": []
+            }
+            entries.append(entry)
+            hunk = None
+
+        elif entry is None:
+            continue
+
+        elif hunk is not None and line[:1] in (" ", "+", "-", "\\"):
+            hunk["lines"].append(line)
+
+        elif line.startswith("@@"):
+            ranges, _, header = line[2:].partition("@@")
+            old_range, new_range = ranges.split()[:2]
+            old_start, _, old_lines = old_range[1:].partition(",")
+            new_start, _, new_lines = new_range[1:].partition(",")
+            hunk = {
+                "old_start": int(old_start),
+                "old_lines": int(old_lines) if old_lines else 1,
+                "new_start": int(new_start),
+                "new_lines": int(new_lines) if new_lines else 1,
+                "header": header.strip(),
+                "lines": []
+            }
+            entry["hunks"].append(hunk)
+
+        elif line.startswith("new file mode"):
+            entry["status"] = "A"
+        elif line.startswith("deleted file mode"):
+            entry["status"] = "D"
+        elif line.startswith("rename from "):
+            entry["status"] = "R"
+            entry["old_path"] = line[len("rename from "):]
+        elif line.startswith("rename to "):
+            entry["path"] = line[len("rename to "):]
+        elif line.startswith("--- "):
+            # git appends a tab to names containing spaces
+            if line != "--- /dev/null":
+                entry["old_path"] = line[len("--- a/"):].rstrip("\t")
+        elif line.startswith("+++ "):
+            if line != "+++ /dev/null":
+                entry["path"] = line[len("+++ b/"):].rstrip("\t")
+        elif line.startswith("Binary files "):
+            entry["binary"] = True
+
+    return entries
+
+
 def git_log(
     path: str = ".",
     max_count: int = 10,
@@ -234,17 +700,55 @@ def git_log(
         raise GitNotRepositoryError(f"Not a Git repository: {path}")
 
     try:
-        cmd = f"git log -n {max_count}"
-        if oneline:
-            cmd += " --oneline"
+        # History below a commit never changes, so the output is reused
+        # until HEAD moves
+        head = _head_oid(path)
+        if head is not None:
+            return _cached_log(os.path.realpath(path), head, max_count, oneline)
 
-        result = run_command(cmd, cwd=path, check=True)
-        return result.stdout
+        return _run_log(path, max_count, oneline)
 
     except CommandExecutionError as e:
         raise GitOperationError(f"Failed to get log: {e}")
 
 
+@lru_cache(maxsize=128)
+def _cached_log(path: str, head: str, max_count: int, oneline: bool) -> str:
+    """
+    Memoized git log, keyed by the HEAD commit id
+
+    Args:
+        path: Resolved repository path
+        head: HEAD commit id (only part of the cache key)
+        max_count: Maximum commits to show
+        oneline: One line per commit
+
+    Returns:
+        Log output
+    """
+    return _run_log(path, max_count, oneline)
+
+
+def _run_log(path: str, max_count: int, oneline: bool) -> str:
+    """
+    Run git log
+
+    Args:
+        path: Repository path
+        max_count: Maximum commits to show
+        oneline: One line per commit
+
+    Returns:
+        Log output
+    """
+    cmd = ["git", "log", "-n", str(max_count)]
+    if oneline:
+        cmd.append("--oneline")
+
+    result = run_command(cmd, cwd=path, check=True)
+    return result.stdout
+
+
 def git_branch(
     path: str = ".",
     list_all: bool = False
@@ -266,7 +770,7 @@ def git_branch(
         raise GitNotRepositoryError(f"Not a Git repository: {path}")
 
     try:
-        cmd = "git branch -a" if list_all else "git branch"
+        cmd = ["git", "branch", "-a"] if list_all else ["git", "branch"]
         result = run_command(cmd, cwd=path, check=True)
 
         # Parse branch list
@@ -308,13 +812,16 @@ def git_checkout(
         raise GitNotRepositoryError(f"Not a Git repository: {path}")
 
     try:
-        cmd = f"git checkout {'-b ' if create else ''}'{branch}'"
+        cmd = ["git", "checkout", "-b", branch] if create else ["git", "checkout", branch]
         result = run_command(cmd, cwd=path, check=True)
         return result.stdout or result.stderr or f"Switched to branch '{branch}'"
 
     except CommandExecutionError as e:
         raise GitOperationError(f"Failed to checkout branch: {e}")
 
+    finally:
+        _worktree_rewritten()
+
 
 def git_current_branch(path: str = ".") -> str:
     """
@@ -333,7 +840,7 @@ def git_current_branch(path: str = ".") -> str:
         raise GitNotRepositoryError(f"Not a Git repository: {path}")
 
     try:
-        result = run_command("git branch --show-current", cwd=path, check=True)
+        result = run_command(["git", "branch", "--show-current"], cwd=path, check=True)
         branch = result.stdout.strip()
         return branch
 
@@ -365,9 +872,9 @@ def git_pull(
         raise GitNotRepositoryError(f"Not a Git repository: {path}")
 
     try:
-        cmd = f"git pull {remote}"
+        cmd = ["git", "pull", remote]
         if branch:
-            cmd += f" {branch}"
+            cmd.append(branch)
 
         result = run_command(cmd, cwd=path, check=True, timeout=60)
         return True
@@ -375,6 +882,9 @@ def git_pull(
     except CommandExecutionError as e:
         raise GitOperationError(f"Failed to pull: {e}")
 
+    finally:
+        _worktree_rewritten()
+
 
 def git_push(
     path: str = ".",
@@ -402,9 +912,9 @@ def git_push(
         raise GitNotRepositoryError(f"Not a Git repository: {path}")
 
     try:
-        cmd = f"git push {'-u ' if set_upstream else ''}{remote}"
+        cmd = ["git", "push", "-u", remote] if set_upstream else ["git", "push", remote]
         if branch:
-            cmd += f" {branch}"
+            cmd.append(branch)
 
         result = run_command(cmd, cwd=path, check=True, timeout=60)
         return True
@@ -433,9 +943,9 @@ def git_clone(
         GitOperationError: Clone failed
     """
     try:
-        cmd = f"git clone {url} '{destination}'"
+        cmd = ["git", "clone", url, destination]
         if branch:
-            cmd += f" -b {branch}"
+            cmd += ["-b", branch]
 
         result = run_command(cmd, check=True, timeout=120)
         return True
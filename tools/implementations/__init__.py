@@ -8,11 +8,17 @@ Provides all tool implementations organized by category:
 - Code quality: Syntax check
 - Code search: Grep, find files, explore directory structure
 - Bash execution: Safe shell command execution
-- Git operations: Status, diff, log, add, commit, checkout
+- Git operations: Status, diff, log, add, commit, checkout, overview
 
-All tools are registered via register_all_tools() function.
+All tools are registered via register_all_tools() function; new tool
+classes are picked up automatically once their module is imported here.
 """
 
+from inspect import isabstract
+
+from core.logger import logger
+from tools.tool_base import get_tool_classes, register_tools
+
 from tools.implementations.control_tools import (
     TaskSuccessTool,
     TaskErrorTool,
@@ -25,6 +31,7 @@ from tools.implementations.file_tools import (
     EditFileTool,
     ListFilesTool,
     FileInfoTool,
+    FilesInfoTool,
     MoveFileTool,
     DeleteFileTool
 )
@@ -51,86 +58,54 @@ from tools.implementations.bash_tools import (
     GitLogTool,
     GitAddTool,
     GitCommitTool,
-    GitCheckoutTool
+    GitCheckoutTool,
+    RepoOverviewTool
+)
+
+
+# Every Tool subclass imported above recorded itself on definition
+_TOOL_CLASSES = tuple(
+    tool_class
+    for tool_class in get_tool_classes()
+    if not isabstract(tool_class)
 )
 
+_registered = False
+
 
 def register_all_tools():
     """
     Register all tool implementations in global registry
 
-    Registers tools from all categories:
-    - 2 system/control tool
-    - 7 file operation tools
+    Idempotent: tools are instantiated and registered on the first call
+    only.
+
+    Registers every Tool subclass defined by the modules imported above,
+    from all categories:
+    - 3 system/control tools
+    - 8 file operation tools
     - 1 web tool
     - 1 code tool
     - 4 search tools
-    - 7 bash and git tools
+    - 8 bash and git tools
 
-    Total: 22 tools
+    Total: 25 tools
     """
-    from tools.tool_base import register_tool
-    from core.logger import logger
-
-    # System / Control tools (2 tools)
-    control_tools = [
-        TaskSuccessTool(),
-        TaskErrorTool(),
-        TasksCompletedTool()
-    ]
-
-    # File operations (7 tools)
-    file_tools = [
-        ReadFileTool(),
-        WriteFileTool(),
-        EditFileTool(),
-        ListFilesTool(),
-        FileInfoTool(),
-        MoveFileTool(),
-        DeleteFileTool()
-    ]
-
-    # Web tools (1 tool)
-    web_tools = [
-        FetchUrlTool()
-    ]
-
-    # Code tools (1 tool)
-    code_tools = [
-        CheckSyntaxTool()
-    ]
-
-    # Search tools (4 tools)
-    search_tools = [
-        GrepTool(),
-        FindFileTool(),
-        GetFileStructureTool(),
-        CodeSearchTool()
-    ]
-
-    # Bash and Git tools (7 tools)
-    bash_tools = [
-        BashTool(),
-        GitStatusTool(),
-        GitDiffTool(),
-        GitLogTool(),
-        GitAddTool(),
-        GitCommitTool(),
-        GitCheckoutTool()
-    ]
-
-    # Register all tools
-    all_tools = (
-        control_tools +
-        file_tools +
-        web_tools +
-        code_tools +
-        search_tools +
-        bash_tools
+    global _registered
+    if _registered:
+        return
+
+    tools = [tool_class() for tool_class in _TOOL_CLASSES]
+    register_tools(tools)
+
+    # One record for the whole batch; the name list is only built if
+    # debug output is enabled
+    logger.debug(
+        "TOOL_REGISTRY",
+        "Registered tools",
+        lambda: {"names": [tool.name for tool in tools]}
     )
-
-    for tool in all_tools:
-        register_tool(tool)
+    _registered = True
 
 
 __all__ = [
@@ -144,6 +119,7 @@ __all__ = [
     'EditFileTool',
     'ListFilesTool',
     'FileInfoTool',
+    'FilesInfoTool',
     'MoveFileTool',
     'DeleteFileTool',
     # Web tools
@@ -163,6 +139,7 @@ __all__ = [
     'GitAddTool',
     'GitCommitTool',
     'GitCheckoutTool',
+    'RepoOverviewTool',
     # Registration function
     'register_all_tools'
 ]
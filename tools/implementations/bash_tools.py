@@ -5,13 +5,60 @@ Provides safe execution of shell commands and Git operations.
 Includes security measures like command whitelisting and timeout handling.
 """
 
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Union
+import asyncio
+import re
 
 from tools.tool_base import Tool, ToolMetadata, ToolParameter
-from tools import shell, git_ops
 from tools.security_constants import DANGEROUS_SHELL_COMMANDS
 
 
+# Substrings rejected anywhere in a bash command, as one alternation
+_DANGEROUS_PATTERN_RE = re.compile(
+    "|".join(map(re.escape, ('rm -rf', '> /dev/', 'dd if=', 'mkfs.')))
+)
+
+# Parameters shared by several tools
+_REPOSITORY_PATH_PARAM = ToolParameter(
+    name="repository_path",
+    type=str,
+    description="Path to Git repository",
+    required=False,
+    default="."
+)
+
+
+_BASH_METADATA = ToolMetadata(
+    name="bash",
+    description="Execute shell command with security checks and timeout",
+    parameters=(
+        ToolParameter(
+            name="command",
+            type=str,
+            description="Command to execute (will be validated for safety)",
+            required=True
+        ),
+        ToolParameter(
+            name="working_directory",
+            type=str,
+            description="Working directory for command execution",
+            required=False,
+            default=None
+        ),
+        ToolParameter(
+            name="timeout",
+            type=int,
+            description="Timeout in seconds (default: 30, max: 300)",
+            required=False,
+            default=30
+        )
+    ),
+    category="shell",
+    dangerous=True
+)
+
+
 class BashTool(Tool):
     """
     Execute bash commands safely
@@ -20,35 +67,7 @@ class BashTool(Tool):
     against whitelist/blacklist and run with timeout protection.
     """
 
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name="bash",
-            description="Execute shell command with security checks and timeout",
-            parameters=[
-                ToolParameter(
-                    name="command",
-                    type=str,
-                    description="Command to execute (will be validated for safety)",
-                    required=True
-                ),
-                ToolParameter(
-                    name="working_directory",
-                    type=str,
-                    description="Working directory for command execution",
-                    required=False,
-                    default=None
-                ),
-                ToolParameter(
-                    name="timeout",
-                    type=int,
-                    description="Timeout in seconds (default: 30, max: 300)",
-                    required=False,
-                    default=30
-                )
-            ],
-            category="shell",
-            dangerous=True
-        )
+    _METADATA = _BASH_METADATA
 
     def execute(
         self,
@@ -73,12 +92,63 @@ class BashTool(Tool):
         # Validate command safety
         self._validate_command_safety(command)
 
-        # Enforce maximum timeout
-        timeout = min(timeout, 300)
+        # Execute command (timeout capped at 300s)
+        from tools import file_ops, git_ops, shell
+        try:
+            result = shell.execute_command(command, working_directory, min(timeout, 300))
+        finally:
+            # The command may have changed the working tree
+            git_ops.invalidate_status_cache()
+            file_ops._clear_stat_cache()
+        return self._format_result(result)
+
+    async def aexecute(
+        self,
+        command: str,
+        working_directory: str = None,
+        timeout: int = 30
+    ) -> Dict[str, Any]:
+        """
+        Execute bash command without blocking the event loop
+
+        Same checks and result as execute(); the process is awaited with
+        asyncio so several commands can run concurrently.
 
-        # Execute command
-        result = shell.execute_command(command, working_directory, timeout)
+        Args:
+            command: Command to execute
+            working_directory: Working directory
+            timeout: Command timeout
 
+        Returns:
+            Dictionary with stdout, stderr, return_code
+
+        Raises:
+            ToolExecutionError: Command is dangerous or execution failed
+        """
+        self._validate_command_safety(command)
+
+        from tools import file_ops, git_ops, shell
+        try:
+            result = await shell.execute_command_async(
+                command, working_directory, min(timeout, 300)
+            )
+        finally:
+            # The command may have changed the working tree
+            git_ops.invalidate_status_cache()
+            file_ops._clear_stat_cache()
+        return self._format_result(result)
+
+    @staticmethod
+    def _format_result(result) -> Dict[str, Any]:
+        """
+        Convert a ShellResult to the tool's result dictionary
+
+        Args:
+            result: ShellResult from tools.shell
+
+        Returns:
+            Dictionary with stdout, stderr, return_code, success
+        """
         return {
             'stdout': result.stdout,
             'stderr': result.stderr,
@@ -98,8 +168,9 @@ class BashTool(Tool):
         """
         from tools.tool_base import ToolExecutionError
 
-        # Extract base command (first word)
-        base_cmd = command.strip().split()[0] if command.strip() else ""
+        # Extract base command (first word) without splitting the rest
+        words = command.split(None, 1)
+        base_cmd = words[0] if words else ""
 
         # Check blacklist
         if base_cmd in DANGEROUS_SHELL_COMMANDS:
@@ -108,12 +179,41 @@ class BashTool(Tool):
             )
 
         # Check for dangerous patterns
-        dangerous_patterns = ['rm -rf', '> /dev/', 'dd if=', 'mkfs.']
-        for pattern in dangerous_patterns:
-            if pattern in command:
-                raise ToolExecutionError(
-                    f"Command contains dangerous pattern: '{pattern}'"
-                )
+        match = _DANGEROUS_PATTERN_RE.search(command)
+        if match:
+            raise ToolExecutionError(
+                f"Command contains dangerous pattern: '{match.group(0)}'"
+            )
+
+
+_GIT_STATUS_METADATA = ToolMetadata(
+    name="git_status",
+    description="Get Git repository status (branch, changes, staged files)",
+    parameters=(
+        ToolParameter(
+            name="repository_path",
+            type=str,
+            description="Path to Git repository (default: current directory)",
+            required=False,
+            default="."
+        ),
+        ToolParameter(
+            name="porcelain",
+            type=bool,
+            description="Use machine-readable format",
+            required=False,
+            default=False
+        ),
+        ToolParameter(
+            name="structured",
+            type=bool,
+            description="Return parsed status (branch, changed, untracked files) instead of text",
+            required=False,
+            default=False
+        )
+    ),
+    category="git"
+)
 
 
 class GitStatusTool(Tool):
@@ -123,47 +223,62 @@ class GitStatusTool(Tool):
     Shows current branch, modified files, staged changes, and untracked files.
     """
 
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name="git_status",
-            description="Get Git repository status (branch, changes, staged files)",
-            parameters=[
-                ToolParameter(
-                    name="repository_path",
-                    type=str,
-                    description="Path to Git repository (default: current directory)",
-                    required=False,
-                    default="."
-                ),
-                ToolParameter(
-                    name="porcelain",
-                    type=bool,
-                    description="Use machine-readable format",
-                    required=False,
-                    default=False
-                )
-            ],
-            category="git"
-        )
+    _METADATA = _GIT_STATUS_METADATA
 
     def execute(
         self,
         repository_path: str = ".",
-        porcelain: bool = False
-    ) -> str:
+        porcelain: bool = False,
+        structured: bool = False
+    ) -> Union[str, Dict[str, Any]]:
         """
         Execute git status
 
         Args:
             repository_path: Repository path
             porcelain: Use porcelain format
+            structured: Return parsed status instead of text
 
         Returns:
-            Git status output
+            Git status output, or parsed status if structured
         """
+        from tools import git_ops
+        if structured:
+            return git_ops.git_status_entries(repository_path)
         return git_ops.git_status(repository_path, porcelain)
 
 
+_GIT_DIFF_METADATA = ToolMetadata(
+    name="git_diff",
+    description="View Git diff of changes (unstaged or staged)",
+    parameters=(
+        _REPOSITORY_PATH_PARAM,
+        ToolParameter(
+            name="staged",
+            type=bool,
+            description="Show staged changes (default: unstaged)",
+            required=False,
+            default=False
+        ),
+        ToolParameter(
+            name="files",
+            type=list,
+            description="Specific files to diff (default: all files)",
+            required=False,
+            default=None
+        ),
+        ToolParameter(
+            name="structured",
+            type=bool,
+            description="Return parsed per-file hunks instead of diff text",
+            required=False,
+            default=False
+        )
+    ),
+    category="git"
+)
+
+
 class GitDiffTool(Tool):
     """
     View Git diff of changes
@@ -172,42 +287,15 @@ class GitDiffTool(Tool):
     or between index and HEAD (committed).
     """
 
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name="git_diff",
-            description="View Git diff of changes (unstaged or staged)",
-            parameters=[
-                ToolParameter(
-                    name="repository_path",
-                    type=str,
-                    description="Path to Git repository",
-                    required=False,
-                    default="."
-                ),
-                ToolParameter(
-                    name="staged",
-                    type=bool,
-                    description="Show staged changes (default: unstaged)",
-                    required=False,
-                    default=False
-                ),
-                ToolParameter(
-                    name="files",
-                    type=list,
-                    description="Specific files to diff (default: all files)",
-                    required=False,
-                    default=None
-                )
-            ],
-            category="git"
-        )
+    _METADATA = _GIT_DIFF_METADATA
 
     def execute(
         self,
         repository_path: str = ".",
         staged: bool = False,
-        files: List[str] = None
-    ) -> str:
+        files: List[str] = None,
+        structured: bool = False
+    ) -> Union[str, List[Dict[str, Any]]]:
         """
         Execute git diff
 
@@ -215,13 +303,41 @@ class GitDiffTool(Tool):
             repository_path: Repository path
             staged: Show staged changes
             files: Specific files
+            structured: Return parsed per-file hunks instead of text
 
         Returns:
-            Git diff output
+            Git diff output, or parsed diff if structured
         """
+        from tools import git_ops
+        if structured:
+            return git_ops.git_diff_entries(repository_path, staged, files)
         return git_ops.git_diff(repository_path, staged, files)
 
 
+_GIT_LOG_METADATA = ToolMetadata(
+    name="git_log",
+    description="View Git commit history",
+    parameters=(
+        _REPOSITORY_PATH_PARAM,
+        ToolParameter(
+            name="max_count",
+            type=int,
+            description="Maximum number of commits to show",
+            required=False,
+            default=10
+        ),
+        ToolParameter(
+            name="oneline",
+            type=bool,
+            description="Show one line per commit",
+            required=False,
+            default=False
+        )
+    ),
+    category="git"
+)
+
+
 class GitLogTool(Tool):
     """
     View Git commit history
@@ -230,35 +346,7 @@ class GitLogTool(Tool):
     Supports limiting number of commits and oneline format.
     """
 
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name="git_log",
-            description="View Git commit history",
-            parameters=[
-                ToolParameter(
-                    name="repository_path",
-                    type=str,
-                    description="Path to Git repository",
-                    required=False,
-                    default="."
-                ),
-                ToolParameter(
-                    name="max_count",
-                    type=int,
-                    description="Maximum number of commits to show",
-                    required=False,
-                    default=10
-                ),
-                ToolParameter(
-                    name="oneline",
-                    type=bool,
-                    description="Show one line per commit",
-                    required=False,
-                    default=False
-                )
-            ],
-            category="git"
-        )
+    _METADATA = _GIT_LOG_METADATA
 
     def execute(
         self,
@@ -277,9 +365,34 @@ class GitLogTool(Tool):
         Returns:
             Git log output
         """
+        from tools import git_ops
         return git_ops.git_log(repository_path, max_count, oneline)
 
 
+_GIT_ADD_METADATA = ToolMetadata(
+    name="git_add",
+    description="Stage files for commit",
+    parameters=(
+        ToolParameter(
+            name="files",
+            type=list,
+            description="List of file paths to stage",
+            required=True
+        ),
+        _REPOSITORY_PATH_PARAM,
+        ToolParameter(
+            name="all_files",
+            type=bool,
+            description="Stage all modified and new files",
+            required=False,
+            default=False
+        )
+    ),
+    category="git",
+    dangerous=True
+)
+
+
 class GitAddTool(Tool):
     """
     Stage files for commit
@@ -287,35 +400,7 @@ class GitAddTool(Tool):
     Adds files to the Git staging area in preparation for commit.
     """
 
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name="git_add",
-            description="Stage files for commit",
-            parameters=[
-                ToolParameter(
-                    name="files",
-                    type=list,
-                    description="List of file paths to stage",
-                    required=True
-                ),
-                ToolParameter(
-                    name="repository_path",
-                    type=str,
-                    description="Path to Git repository",
-                    required=False,
-                    default="."
-                ),
-                ToolParameter(
-                    name="all_files",
-                    type=bool,
-                    description="Stage all modified and new files",
-                    required=False,
-                    default=False
-                )
-            ],
-            category="git",
-            dangerous=True
-        )
+    _METADATA = _GIT_ADD_METADATA
 
     def execute(
         self,
@@ -334,9 +419,27 @@ class GitAddTool(Tool):
         Returns:
             True if successful
         """
+        from tools import git_ops
         return git_ops.git_add(files, repository_path, all_files)
 
 
+_GIT_COMMIT_METADATA = ToolMetadata(
+    name="git_commit",
+    description="Create Git commit with staged changes",
+    parameters=(
+        ToolParameter(
+            name="message",
+            type=str,
+            description="Commit message",
+            required=True
+        ),
+        _REPOSITORY_PATH_PARAM
+    ),
+    category="git",
+    dangerous=True
+)
+
+
 class GitCommitTool(Tool):
     """
     Create Git commit
@@ -344,28 +447,7 @@ class GitCommitTool(Tool):
     Creates a new commit with the given message for all staged changes.
     """
 
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name="git_commit",
-            description="Create Git commit with staged changes",
-            parameters=[
-                ToolParameter(
-                    name="message",
-                    type=str,
-                    description="Commit message",
-                    required=True
-                ),
-                ToolParameter(
-                    name="repository_path",
-                    type=str,
-                    description="Path to Git repository",
-                    required=False,
-                    default="."
-                )
-            ],
-            category="git",
-            dangerous=True
-        )
+    _METADATA = _GIT_COMMIT_METADATA
 
     def execute(
         self,
@@ -382,24 +464,105 @@ class GitCommitTool(Tool):
         Returns:
             Commit result message
         """
+        from tools import git_ops
         return git_ops.git_commit(message, repository_path)
 
 
+_GIT_CHECKOUT_METADATA = ToolMetadata(
+    name="git_checkout",
+    description="Switch branch or create new one",
+    parameters=(
+        ToolParameter(name="branch_name", type=str, description="Name of the branch", required=True),
+        ToolParameter(name="create_new", type=bool, description="Create new branch (-b)", default=False),
+        ToolParameter(name="path", type=str, description="Repo path", default=".")
+    ),
+    category="git",
+    dangerous=True
+)
+
+
 class GitCheckoutTool(Tool):
     """Tool for managing branches"""
     
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name="git_checkout",
-            description="Switch branch or create new one",
-            parameters=[
-                ToolParameter(name="branch_name", type=str, description="Name of the branch", required=True),
-                ToolParameter(name="create_new", type=bool, description="Create new branch (-b)", default=False),
-                ToolParameter(name="path", type=str, description="Repo path", default=".")
-            ],
-            category="git",
-            dangerous=True
-        )
+    _METADATA = _GIT_CHECKOUT_METADATA
 
     def execute(self, branch_name: str, create_new: bool = False, path: str = ".") -> str:
-        return git_ops.git_checkout(branch_name, create_new, path)
+        from tools import git_ops
+        return git_ops.git_checkout(branch_name, path=path, create=create_new)
+
+
+_REPO_OVERVIEW_METADATA = ToolMetadata(
+    name="repo_overview",
+    description="Get Git status, recent commits and unstaged diff in one call",
+    parameters=(
+        _REPOSITORY_PATH_PARAM,
+        ToolParameter(
+            name="max_count",
+            type=int,
+            description="Maximum number of commits to show",
+            required=False,
+            default=10
+        )
+    ),
+    category="git"
+)
+
+
+class RepoOverviewTool(Tool):
+    """
+    Survey a Git repository
+
+    Runs git status, git log (one line per commit) and git diff
+    concurrently and returns the three outputs together.
+    """
+
+    _METADATA = _REPO_OVERVIEW_METADATA
+
+    def execute(
+        self,
+        repository_path: str = ".",
+        max_count: int = 10
+    ) -> Dict[str, str]:
+        """
+        Execute repository overview
+
+        Args:
+            repository_path: Repository path
+            max_count: Maximum commits
+
+        Returns:
+            Dictionary with status, log and diff output
+        """
+        from tools import git_ops
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            status = pool.submit(git_ops.git_status, repository_path)
+            log = pool.submit(git_ops.git_log, repository_path, max_count, True)
+            diff = pool.submit(git_ops.git_diff, repository_path)
+            return {
+                'status': status.result(),
+                'log': log.result(),
+                'diff': diff.result()
+            }
+
+    async def aexecute(
+        self,
+        repository_path: str = ".",
+        max_count: int = 10
+    ) -> Dict[str, str]:
+        """
+        Execute repository overview without blocking the event loop
+
+        Args:
+            repository_path: Repository path
+            max_count: Maximum commits
+
+        Returns:
+            Dictionary with status, log and diff output
+        """
+        from tools import git_ops
+        status, log, diff = await asyncio.gather(
+            asyncio.to_thread(git_ops.git_status, repository_path),
+            asyncio.to_thread(git_ops.git_log, repository_path, max_count, True),
+            asyncio.to_thread(git_ops.git_diff, repository_path)
+        )
+        return {'status': status, 'log': log, 'diff': diff}
@@ -8,26 +8,46 @@ from typing import Dict, Any
 from tools.tool_base import Tool, ToolMetadata, ToolParameter
 from tools.tool_ids import ToolId
 
+
+_DEFAULT_SUCCESS_MESSAGE = "Task completed successfully."
+_DEFAULT_COMPLETED_MESSAGE = "All tasks completed successfully."
+
+# Results for the default messages, shared by every call; treat as read-only.
+# (Plain dicts: callers check isinstance(result, dict).)
+_DEFAULT_SUCCESS_RESULT = {
+    "success": True,
+    "status": "success",
+    "message": _DEFAULT_SUCCESS_MESSAGE
+}
+_DEFAULT_COMPLETED_RESULT = {
+    "success": True,
+    "status": "completed",
+    "message": _DEFAULT_COMPLETED_MESSAGE
+}
+
+
+_TASK_SUCCESS_METADATA = ToolMetadata(
+    name=ToolId.TASK_SUCCESS.value,
+    description="Call this when the objective is achieved.",
+    parameters=(
+        ToolParameter(
+            name="message",
+            type=str,
+            description="Final summary of what was achieved",
+            required=False,
+            default=_DEFAULT_SUCCESS_MESSAGE
+        ),
+    ),
+    category="system"
+)
+
+
 class TaskSuccessTool(Tool):
     """Tool explicitly used to signal task success"""
 
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name=ToolId.TASK_SUCCESS.value,
-            description="Call this when the objective is achieved.",
-            parameters=[
-                ToolParameter(
-                    name="message",
-                    type=str,
-                    description="Final summary of what was achieved",
-                    required=False,
-                    default="Task completed successfully."
-                )
-            ],
-            category="system"
-        )
-
-    def execute(self, message: str = "Task completed successfully.") -> Dict[str, Any]:
+    _METADATA = _TASK_SUCCESS_METADATA
+
+    def execute(self, message: str = _DEFAULT_SUCCESS_MESSAGE) -> Dict[str, Any]:
         """
         Signals task success.
 
@@ -37,6 +57,8 @@ class TaskSuccessTool(Tool):
         Returns:
             Dictionary indicating success and status.
         """
+        if message == _DEFAULT_SUCCESS_MESSAGE:
+            return _DEFAULT_SUCCESS_RESULT
         return {
             "success": True,
             "status": "success",
@@ -44,23 +66,25 @@ class TaskSuccessTool(Tool):
         }
 
 
+_TASK_ERROR_METADATA = ToolMetadata(
+    name=ToolId.TASK_ERROR.value,
+    description="Call this when the objective cannot be achieved due to an error.",
+    parameters=(
+        ToolParameter(
+            name="error_message",
+            type=str,
+            description="Detailed description of the error",
+            required=True
+        ),
+    ),
+    category="system"
+)
+
+
 class TaskErrorTool(Tool):
     """Tool explicitly used to signal task failure"""
 
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name=ToolId.TASK_ERROR.value,
-            description="Call this when the objective cannot be achieved due to an error.",
-            parameters=[
-                ToolParameter(
-                    name="error_message",
-                    type=str,
-                    description="Detailed description of the error",
-                    required=True
-                )
-            ],
-            category="system"
-        )
+    _METADATA = _TASK_ERROR_METADATA
 
     def execute(self, error_message: str) -> Dict[str, Any]:
         """
@@ -79,26 +103,28 @@ class TaskErrorTool(Tool):
         }
 
 
+_TASKS_COMPLETED_METADATA = ToolMetadata(
+    name=ToolId.TASKS_COMPLETED.value,
+    description="Call this when the ENTIRE user query/objective is achieved.",
+    parameters=(
+        ToolParameter(
+            name="message",
+            type=str,
+            description="Final summary of what was achieved",
+            required=False,
+            default=_DEFAULT_COMPLETED_MESSAGE
+        ),
+    ),
+    category="system"
+)
+
+
 class TasksCompletedTool(Tool):
     """Tool explicitly used to signal that the entire user request is completed"""
 
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name=ToolId.TASKS_COMPLETED.value,
-            description="Call this when the ENTIRE user query/objective is achieved.",
-            parameters=[
-                ToolParameter(
-                    name="message",
-                    type=str,
-                    description="Final summary of what was achieved",
-                    required=False,
-                    default="All tasks completed successfully."
-                )
-            ],
-            category="system"
-        )
-
-    def execute(self, message: str = "All tasks completed successfully.") -> Dict[str, Any]:
+    _METADATA = _TASKS_COMPLETED_METADATA
+
+    def execute(self, message: str = _DEFAULT_COMPLETED_MESSAGE) -> Dict[str, Any]:
         """
         Signals global completion.
 
@@ -108,6 +134,8 @@ class TasksCompletedTool(Tool):
         Returns:
             Dictionary indicating success and status.
         """
+        if message == _DEFAULT_COMPLETED_MESSAGE:
+            return _DEFAULT_COMPLETED_RESULT
         return {
             "success": True,
             "status": "completed",
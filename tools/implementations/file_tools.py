@@ -6,10 +6,38 @@ Each tool wraps the corresponding file operation with proper validation
 and error handling.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 
 from tools.tool_base import Tool, ToolMetadata, ToolParameter
-from tools import file_ops
+
+
+_READ_FILE_METADATA = ToolMetadata(
+    name="read_file",
+    description="Read file contents with optional line range",
+    parameters=(
+        ToolParameter(
+            name="file_path",
+            type=str,
+            description="Path to the file to read",
+            required=True
+        ),
+        ToolParameter(
+            name="start_line",
+            type=int,
+            description="Line number to start reading from (0-indexed)",
+            required=False,
+            default=0
+        ),
+        ToolParameter(
+            name="num_lines",
+            type=int,
+            description="Maximum number of lines to read (None for all)",
+            required=False,
+            default=None
+        )
+    ),
+    category="file_operations"
+)
 
 
 class ReadFileTool(Tool):
@@ -20,34 +48,7 @@ class ReadFileTool(Tool):
     Useful for viewing source code or configuration files.
     """
 
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name="read_file",
-            description="Read file contents with optional line range",
-            parameters=[
-                ToolParameter(
-                    name="file_path",
-                    type=str,
-                    description="Path to the file to read",
-                    required=True
-                ),
-                ToolParameter(
-                    name="start_line",
-                    type=int,
-                    description="Line number to start reading from (0-indexed)",
-                    required=False,
-                    default=0
-                ),
-                ToolParameter(
-                    name="num_lines",
-                    type=int,
-                    description="Maximum number of lines to read (None for all)",
-                    required=False,
-                    default=None
-                )
-            ],
-            category="file_operations"
-        )
+    _METADATA = _READ_FILE_METADATA
 
     def execute(
         self,
@@ -66,9 +67,39 @@ class ReadFileTool(Tool):
         Returns:
             File contents as string
         """
+        from tools import file_ops
         return file_ops.read_file(file_path, start_line, num_lines)
 
 
+_WRITE_FILE_METADATA = ToolMetadata(
+    name="write_file",
+    description="Write content to file (creates or overwrites)",
+    parameters=(
+        ToolParameter(
+            name="file_path",
+            type=str,
+            description="Path to the file to write",
+            required=True
+        ),
+        ToolParameter(
+            name="content",
+            type=str,
+            description="Content to write to the file",
+            required=True
+        ),
+        ToolParameter(
+            name="create_dirs",
+            type=bool,
+            description="Create parent directories if they don't exist",
+            required=False,
+            default=True
+        )
+    ),
+    category="file_operations",
+    dangerous=True
+)
+
+
 class WriteFileTool(Tool):
     """
     Write or create new file
@@ -77,34 +108,7 @@ class WriteFileTool(Tool):
     Can optionally create parent directories if they don't exist.
     """
 
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name="write_file",
-            description="Write content to file (creates or overwrites)",
-            parameters=[
-                ToolParameter(
-                    name="file_path",
-                    type=str,
-                    description="Path to the file to write",
-                    required=True
-                ),
-                ToolParameter(
-                    name="content",
-                    type=str,
-                    description="Content to write to the file",
-                    required=True
-                ),
-                ToolParameter(
-                    name="create_dirs",
-                    type=bool,
-                    description="Create parent directories if they don't exist",
-                    required=False,
-                    default=True
-                )
-            ],
-            category="file_operations",
-            dangerous=True
-        )
+    _METADATA = _WRITE_FILE_METADATA
 
     def execute(
         self,
@@ -123,10 +127,46 @@ class WriteFileTool(Tool):
         Returns:
             A string indicating successful write operation.
         """
+        from tools import file_ops
         file_ops.write_file(file_path, content, create_dirs)
         return f"Successfully wrote to {file_path}"
 
 
+_EDIT_FILE_METADATA = ToolMetadata(
+    name="edit_file",
+    description="Edit file by finding and replacing exact text match",
+    parameters=(
+        ToolParameter(
+            name="file_path",
+            type=str,
+            description="Path to the file to edit",
+            required=True
+        ),
+        ToolParameter(
+            name="old_text",
+            type=str,
+            description="Exact text to find (must match exactly)",
+            required=True
+        ),
+        ToolParameter(
+            name="new_text",
+            type=str,
+            description="Text to replace with",
+            required=True
+        ),
+        ToolParameter(
+            name="replace_all",
+            type=bool,
+            description="Replace all occurrences (default: first only)",
+            required=False,
+            default=False
+        )
+    ),
+    category="file_operations",
+    dangerous=True
+)
+
+
 class EditFileTool(Tool):
     """
     Edit file with find and replace
@@ -135,40 +175,7 @@ class EditFileTool(Tool):
     Can replace first occurrence or all occurrences.
     """
 
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name="edit_file",
-            description="Edit file by finding and replacing exact text match",
-            parameters=[
-                ToolParameter(
-                    name="file_path",
-                    type=str,
-                    description="Path to the file to edit",
-                    required=True
-                ),
-                ToolParameter(
-                    name="old_text",
-                    type=str,
-                    description="Exact text to find (must match exactly)",
-                    required=True
-                ),
-                ToolParameter(
-                    name="new_text",
-                    type=str,
-                    description="Text to replace with",
-                    required=True
-                ),
-                ToolParameter(
-                    name="replace_all",
-                    type=bool,
-                    description="Replace all occurrences (default: first only)",
-                    required=False,
-                    default=False
-                )
-            ],
-            category="file_operations",
-            dangerous=True
-        )
+    _METADATA = _EDIT_FILE_METADATA
 
     def execute(
         self,
@@ -189,9 +196,54 @@ class EditFileTool(Tool):
         Returns:
             True if replacement was made
         """
+        from tools import file_ops
         return file_ops.edit_file(file_path, old_text, new_text, replace_all)
 
 
+_LIST_FILES_METADATA = ToolMetadata(
+    name="list_files",
+    description="List files and directories with optional filtering",
+    parameters=(
+        ToolParameter(
+            name="directory",
+            type=str,
+            description="Directory path to list (default: current directory)",
+            required=False,
+            default="."
+        ),
+        ToolParameter(
+            name="include_hidden",
+            type=bool,
+            description="Include hidden files (starting with .)",
+            required=False,
+            default=False
+        ),
+        ToolParameter(
+            name="files_only",
+            type=bool,
+            description="Show only files (exclude directories)",
+            required=False,
+            default=False
+        ),
+        ToolParameter(
+            name="dirs_only",
+            type=bool,
+            description="Show only directories (exclude files)",
+            required=False,
+            default=False
+        ),
+        ToolParameter(
+            name="columnar",
+            type=bool,
+            description="Return one list per field (name, path, size, ...) instead of one object per entry",
+            required=False,
+            default=False
+        )
+    ),
+    category="file_operations"
+)
+
+
 class ListFilesTool(Tool):
     """
     List files in directory
@@ -200,50 +252,16 @@ class ListFilesTool(Tool):
     filtering for files-only or directories-only.
     """
 
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name="list_files",
-            description="List files and directories with optional filtering",
-            parameters=[
-                ToolParameter(
-                    name="directory",
-                    type=str,
-                    description="Directory path to list (default: current directory)",
-                    required=False,
-                    default="."
-                ),
-                ToolParameter(
-                    name="include_hidden",
-                    type=bool,
-                    description="Include hidden files (starting with .)",
-                    required=False,
-                    default=False
-                ),
-                ToolParameter(
-                    name="files_only",
-                    type=bool,
-                    description="Show only files (exclude directories)",
-                    required=False,
-                    default=False
-                ),
-                ToolParameter(
-                    name="dirs_only",
-                    type=bool,
-                    description="Show only directories (exclude files)",
-                    required=False,
-                    default=False
-                )
-            ],
-            category="file_operations"
-        )
+    _METADATA = _LIST_FILES_METADATA
 
     def execute(
         self,
         directory: str = ".",
         include_hidden: bool = False,
         files_only: bool = False,
-        dirs_only: bool = False
-    ) -> List[Dict[str, Any]]:
+        dirs_only: bool = False,
+        columnar: bool = False
+    ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Execute directory listing
 
@@ -252,12 +270,30 @@ class ListFilesTool(Tool):
             include_hidden: Include hidden files
             files_only: Only list files
             dirs_only: Only list directories
+            columnar: Return one list per field
 
         Returns:
-            List of entries with metadata
+            List of entries with metadata (or field -> values if columnar)
         """
-        from .. import search
-        return search.list_directory(directory, include_hidden, files_only, dirs_only)
+        from tools import search
+        return search.list_directory(
+            directory, include_hidden, files_only, dirs_only, columnar
+        )
+
+
+_FILE_INFO_METADATA = ToolMetadata(
+    name="file_info",
+    description="Get detailed file metadata (size, permissions, timestamps)",
+    parameters=(
+        ToolParameter(
+            name="file_path",
+            type=str,
+            description="Path to the file",
+            required=True
+        ),
+    ),
+    category="file_operations"
+)
 
 
 class FileInfoTool(Tool):
@@ -268,20 +304,7 @@ class FileInfoTool(Tool):
     permissions, and timestamps.
     """
 
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name="file_info",
-            description="Get detailed file metadata (size, permissions, timestamps)",
-            parameters=[
-                ToolParameter(
-                    name="file_path",
-                    type=str,
-                    description="Path to the file",
-                    required=True
-                )
-            ],
-            category="file_operations"
-        )
+    _METADATA = _FILE_INFO_METADATA
 
     def execute(self, file_path: str) -> Dict[str, Any]:
         """
@@ -293,42 +316,113 @@ class FileInfoTool(Tool):
         Returns:
             Dictionary with file metadata
         """
+        from tools import file_ops
         return file_ops.get_file_info(file_path)
 
+    async def aexecute_many(self, file_paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get metadata for several files without blocking the event loop
+
+        Args:
+            file_paths: Paths to files
+
+        Returns:
+            File metadata dictionaries, in the same order as file_paths
+        """
+        from tools import file_ops
+        return await file_ops.get_file_infos_async(file_paths)
+
+
+_FILES_INFO_METADATA = ToolMetadata(
+    name="files_info",
+    description="Get file metadata (size, permissions, timestamps) for several files at once",
+    parameters=(
+        ToolParameter(
+            name="file_paths",
+            type=list,
+            description="Paths of the files",
+            required=True
+        ),
+    ),
+    category="file_operations"
+)
+
+
+class FilesInfoTool(Tool):
+    """
+    Get metadata for several files
+
+    Batch form of file_info: the files are inspected concurrently.
+    """
+
+    _METADATA = _FILES_INFO_METADATA
+
+    def execute(self, file_paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Execute batch file info retrieval
+
+        Args:
+            file_paths: Paths to files
+
+        Returns:
+            File metadata dictionaries, in the same order as file_paths
+        """
+        from tools import file_ops
+        return file_ops.get_file_infos_batch(file_paths)
+
+    async def aexecute(self, file_paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Execute batch file info retrieval without blocking the event loop
+
+        Args:
+            file_paths: Paths to files
+
+        Returns:
+            File metadata dictionaries, in the same order as file_paths
+        """
+        from tools import file_ops
+        return await file_ops.get_file_infos_async(file_paths)
+
+
+_MOVE_FILE_METADATA = ToolMetadata(
+    name="move_path",
+    description="Move or rename a file or directory",
+    parameters=(
+        ToolParameter(name="src", type=str, description="Source path", required=True),
+        ToolParameter(name="dst", type=str, description="Destination path", required=True)
+    ),
+    category="file_operations",
+    dangerous=True
+)
+
 
 class MoveFileTool(Tool):
     """Tool for moving or renaming files/directories"""
     
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name="move_path",
-            description="Move or rename a file or directory",
-            parameters=[
-                ToolParameter(name="src", type=str, description="Source path", required=True),
-                ToolParameter(name="dst", type=str, description="Destination path", required=True)
-            ],
-            category="file_operations",
-            dangerous=True
-        )
+    _METADATA = _MOVE_FILE_METADATA
 
     def execute(self, src: str, dst: str) -> str:
+        from tools import file_ops
         return file_ops.move_path(src, dst)
 
 
+_DELETE_FILE_METADATA = ToolMetadata(
+    name="delete_path",
+    description="Delete a file or directory",
+    parameters=(
+        ToolParameter(name="path", type=str, description="Path to delete", required=True),
+        ToolParameter(name="force", type=bool, description="Force delete (required for directories)", default=False)
+    ),
+    category="file_operations",
+    dangerous=True
+)
+
+
 class DeleteFileTool(Tool):
     """Tool for deleting files/directories"""
     
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name="delete_path",
-            description="Delete a file or directory",
-            parameters=[
-                ToolParameter(name="path", type=str, description="Path to delete", required=True),
-                ToolParameter(name="force", type=bool, description="Force delete (required for directories)", default=False)
-            ],
-            category="file_operations",
-            dangerous=True
-        )
+    _METADATA = _DELETE_FILE_METADATA
 
     def execute(self, path: str, force: bool = False) -> str:
+        from tools import file_ops
         return file_ops.delete_path(path, force)
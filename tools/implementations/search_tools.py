@@ -5,11 +5,54 @@ Provides tools for searching code, finding files, and exploring codebase structu
 Uses efficient search methods including glob patterns and regex.
 """
 
-from typing import List, Dict, Any
-from pathlib import Path
+from typing import FrozenSet, Iterable, Iterator, List, Dict, Any
+import io
+import os
+import time
 
 from tools.tool_base import Tool, ToolMetadata, ToolParameter
-from tools import search
+
+
+# Parameters shared by several tools
+_PATTERN_PARAM = ToolParameter(
+    name="pattern",
+    type=str,
+    description="Regex pattern to search for",
+    required=True
+)
+
+_DIRECTORY_PARAM = ToolParameter(
+    name="directory",
+    type=str,
+    description="Directory to search in (default: current directory)",
+    required=False,
+    default="."
+)
+
+
+_GREP_METADATA = ToolMetadata(
+    name="grep",
+    description="Search file contents for text pattern (regex supported)",
+    parameters=(
+        _PATTERN_PARAM,
+        _DIRECTORY_PARAM,
+        ToolParameter(
+            name="file_pattern",
+            type=str,
+            description="File pattern filter (e.g., '*.py' for Python files)",
+            required=False,
+            default=None
+        ),
+        ToolParameter(
+            name="case_sensitive",
+            type=bool,
+            description="Whether search should be case-sensitive",
+            required=False,
+            default=True
+        )
+    ),
+    category="search"
+)
 
 
 class GrepTool(Tool):
@@ -20,41 +63,7 @@ class GrepTool(Tool):
     and case-insensitive searches with file pattern filtering.
     """
 
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name="grep",
-            description="Search file contents for text pattern (regex supported)",
-            parameters=[
-                ToolParameter(
-                    name="pattern",
-                    type=str,
-                    description="Regex pattern to search for",
-                    required=True
-                ),
-                ToolParameter(
-                    name="directory",
-                    type=str,
-                    description="Directory to search in (default: current directory)",
-                    required=False,
-                    default="."
-                ),
-                ToolParameter(
-                    name="file_pattern",
-                    type=str,
-                    description="File pattern filter (e.g., '*.py' for Python files)",
-                    required=False,
-                    default=None
-                ),
-                ToolParameter(
-                    name="case_sensitive",
-                    type=bool,
-                    description="Whether search should be case-sensitive",
-                    required=False,
-                    default=True
-                )
-            ],
-            category="search"
-        )
+    _METADATA = _GREP_METADATA
 
     def execute(
         self,
@@ -75,7 +84,34 @@ class GrepTool(Tool):
         Returns:
             List of matches with file, line number, and content
         """
-        return search.grep_content(pattern, directory, file_pattern, case_sensitive)
+        from tools import search
+        # Compiled once (cached by pattern string); errors surface before
+        # the tree is walked
+        regex = search.compile_pattern(pattern, case_sensitive)
+        return search.grep_content(regex, directory, file_pattern, case_sensitive)
+
+
+_FIND_FILE_METADATA = ToolMetadata(
+    name="find_file",
+    description="Find files by name pattern (glob patterns supported)",
+    parameters=(
+        ToolParameter(
+            name="name_pattern",
+            type=str,
+            description="Name pattern to match (e.g., '*.py', 'config.*')",
+            required=True
+        ),
+        _DIRECTORY_PARAM,
+        ToolParameter(
+            name="recursive",
+            type=bool,
+            description="Search in subdirectories recursively",
+            required=False,
+            default=True
+        )
+    ),
+    category="search"
+)
 
 
 class FindFileTool(Tool):
@@ -86,34 +122,43 @@ class FindFileTool(Tool):
     Supports recursive directory traversal.
     """
 
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name="find_file",
-            description="Find files by name pattern (glob patterns supported)",
-            parameters=[
-                ToolParameter(
-                    name="name_pattern",
-                    type=str,
-                    description="Name pattern to match (e.g., '*.py', 'config.*')",
-                    required=True
-                ),
-                ToolParameter(
-                    name="directory",
-                    type=str,
-                    description="Directory to search in (default: current directory)",
-                    required=False,
-                    default="."
-                ),
-                ToolParameter(
-                    name="recursive",
-                    type=bool,
-                    description="Search in subdirectories recursively",
-                    required=False,
-                    default=True
-                )
-            ],
-            category="search"
-        )
+    _METADATA = _FIND_FILE_METADATA
+
+    # Cached stats are dropped after this many seconds, or earlier when
+    # the searched directory itself changes
+    CACHE_TTL = 2.0
+
+    def __init__(self):
+        super().__init__()
+        self._stat_cache: Dict[str, os.stat_result] = {}
+        self._root_mtimes: Dict[str, int] = {}
+        self._cache_time = time.monotonic()
+
+    def clear_cache(self):
+        """Drop all cached stat results"""
+        self._stat_cache.clear()
+        self._root_mtimes.clear()
+        self._cache_time = time.monotonic()
+
+    def _refresh_cache(self, directory: str):
+        """
+        Invalidate the stat cache if it expired or the directory changed
+
+        Args:
+            directory: Directory about to be searched
+        """
+        if time.monotonic() - self._cache_time > self.CACHE_TTL:
+            self.clear_cache()
+
+        try:
+            root_mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return
+
+        root = os.path.abspath(directory)
+        if self._root_mtimes.get(root, root_mtime) != root_mtime:
+            self.clear_cache()
+        self._root_mtimes[root] = root_mtime
 
     def execute(
         self,
@@ -132,7 +177,51 @@ class FindFileTool(Tool):
         Returns:
             List of matching file paths
         """
-        return search.glob_files(name_pattern, directory, recursive)
+        from tools import search
+        self._refresh_cache(directory)
+        return search.glob_files(
+            name_pattern,
+            directory,
+            recursive,
+            stat_cache=self._stat_cache
+        )
+
+
+_GET_FILE_STRUCTURE_METADATA = ToolMetadata(
+    name="get_file_structure",
+    description="Get directory tree structure (tree-like visualization)",
+    parameters=(
+        ToolParameter(
+            name="directory",
+            type=str,
+            description="Directory to analyze (default: current directory)",
+            required=False,
+            default="."
+        ),
+        ToolParameter(
+            name="max_depth",
+            type=int,
+            description="Maximum depth to traverse (0 for unlimited)",
+            required=False,
+            default=3
+        ),
+        ToolParameter(
+            name="include_hidden",
+            type=bool,
+            description="Include hidden files and directories",
+            required=False,
+            default=False
+        ),
+        ToolParameter(
+            name="exclude",
+            type=list,
+            description="Names to leave out of the tree (default: dependency, cache and build directories; [] to show everything)",
+            required=False,
+            default=None
+        )
+    ),
+    category="search"
+)
 
 
 class GetFileStructureTool(Tool):
@@ -143,41 +232,21 @@ class GetFileStructureTool(Tool):
     Useful for understanding project layout and organization.
     """
 
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name="get_file_structure",
-            description="Get directory tree structure (tree-like visualization)",
-            parameters=[
-                ToolParameter(
-                    name="directory",
-                    type=str,
-                    description="Directory to analyze (default: current directory)",
-                    required=False,
-                    default="."
-                ),
-                ToolParameter(
-                    name="max_depth",
-                    type=int,
-                    description="Maximum depth to traverse (0 for unlimited)",
-                    required=False,
-                    default=3
-                ),
-                ToolParameter(
-                    name="include_hidden",
-                    type=bool,
-                    description="Include hidden files and directories",
-                    required=False,
-                    default=False
-                )
-            ],
-            category="search"
-        )
+    _METADATA = _GET_FILE_STRUCTURE_METADATA
+
+    # Entries skipped unless the caller passes its own exclude list; these
+    # directories are rarely of interest and often dominate the walk
+    _DEFAULT_EXCLUDES = frozenset({
+        'node_modules', '__pycache__', '.venv', 'venv', '.git',
+        'dist', 'build', '.mypy_cache', '.pytest_cache'
+    })
 
     def execute(
         self,
         directory: str = ".",
         max_depth: int = 3,
-        include_hidden: bool = False
+        include_hidden: bool = False,
+        exclude: List[str] = None
     ) -> str:
         """
         Execute directory tree generation
@@ -186,83 +255,202 @@ class GetFileStructureTool(Tool):
             directory: Root directory
             max_depth: Maximum depth to traverse
             include_hidden: Include hidden entries
+            exclude: Entry names to skip (None for the default set)
 
         Returns:
             Tree structure as formatted string
         """
-        return self._build_tree_structure(directory, max_depth, include_hidden)
+        return self._build_tree_structure(directory, max_depth, include_hidden, exclude)
 
     def _build_tree_structure(
         self,
         directory: str,
         max_depth: int,
-        include_hidden: bool
+        include_hidden: bool,
+        exclude: Iterable[str] = None
     ) -> str:
         """
-        Build tree structure recursively
+        Build tree structure
 
         Args:
             directory: Directory path
             max_depth: Maximum depth
             include_hidden: Include hidden files
+            exclude: Entry names to skip (None for the default set)
 
         Returns:
             Formatted tree string
         """
-        path = Path(directory)
-        if not path.exists():
+        if not os.path.exists(directory):
             return f"Directory not found: {directory}"
 
-        lines = [str(path.absolute())]
-        self._add_tree_entries(path, lines, "", max_depth, 0, include_hidden)
-        return "\n".join(lines)
-
-    def _add_tree_entries(
+        # Lines are written out as they are produced instead of being
+        # collected in a list first
+        buf = io.StringIO()
+        lines = self.iter_tree_lines(directory, max_depth, include_hidden, exclude)
+        buf.write(next(lines))
+        for line in lines:
+            buf.write("\n")
+            buf.write(line)
+        return buf.getvalue()
+
+    def iter_tree_lines(
         self,
-        path: Path,
-        lines: List[str],
-        prefix: str,
-        max_depth: int,
-        current_depth: int,
-        include_hidden: bool
-    ):
+        directory: str,
+        max_depth: int = 3,
+        include_hidden: bool = False,
+        exclude: Iterable[str] = None
+    ) -> Iterator[str]:
         """
-        Recursively add tree entries
+        Generate the tree structure line by line
+
+        Walks the tree depth-first with an explicit stack (no recursion,
+        so deep trees cannot exhaust the Python stack). The first line is
+        the absolute, normalized root path.
 
         Args:
-            path: Current path
-            lines: Output lines list
-            prefix: Current prefix for tree drawing
-            max_depth: Maximum depth
-            current_depth: Current depth
+            directory: Directory path (must exist)
+            max_depth: Maximum depth (0 for unlimited)
+            include_hidden: Include hidden files
+            exclude: Entry names to skip (None for the default set)
+
+        Yields:
+            Tree lines, without trailing newlines
+        """
+        yield os.path.abspath(directory)
+
+        exclude = self._DEFAULT_EXCLUDES if exclude is None else frozenset(exclude)
+
+        # Each frame: (entries still to print, reversed; prefix; depth)
+        stack = [(self._list_tree_entries(directory, include_hidden, exclude), "", 0)]
+        while stack:
+            entries, prefix, depth = stack[-1]
+            if not entries:
+                stack.pop()
+                continue
+
+            is_file, name, entry_path = entries.pop()
+            is_last = not entries
+            yield f"{prefix}{'└── ' if is_last else '├── '}{name}"
+
+            if not is_file and not (max_depth > 0 and depth + 1 >= max_depth):
+                stack.append((
+                    self._list_tree_entries(entry_path, include_hidden, exclude),
+                    prefix + ("    " if is_last else "│   "),
+                    depth + 1
+                ))
+
+    @staticmethod
+    def _list_tree_entries(
+        path: str,
+        include_hidden: bool,
+        exclude: FrozenSet[str] = frozenset()
+    ) -> List[tuple]:
+        """
+        List one directory for the tree
+
+        Uses os.scandir so directory checks come from the listing itself
+        (symlinks alone need a stat) instead of one stat per Path.
+
+        Args:
+            path: Directory path
             include_hidden: Include hidden entries
+            exclude: Entry names to skip
+
+        Returns:
+            (is_file, name, path) tuples, directories first then by name,
+            in reverse order (so pop() yields them in display order);
+            empty if the directory cannot be read
         """
-        if max_depth > 0 and current_depth >= max_depth:
-            return
+        try:
+            with os.scandir(path) as it:
+                # Hidden and excluded entries are dropped before they are
+                # classified or sorted, so excluded directories are never
+                # walked
+                entries = sorted(
+                    (not GetFileStructureTool._is_dir(entry), entry.name, entry.path)
+                    for entry in it
+                    if (include_hidden or not entry.name.startswith('.'))
+                    and entry.name not in exclude
+                )
+        except OSError:
+            # Unreadable, vanished or no longer a directory
+            return []
+
+        entries.reverse()
+        return entries
 
+    @staticmethod
+    def _is_dir(entry: os.DirEntry) -> bool:
+        """
+        Check whether a directory entry is (or links to) a directory
+
+        Like Path.is_dir(), entries that cannot be stat'ed (symlink loops,
+        entries removed mid-walk) count as files instead of raising.
+        """
         try:
-            entries = sorted(path.iterdir(), key=lambda p: (not p.is_dir(), p.name))
-
-            if not include_hidden:
-                entries = [e for e in entries if not e.name.startswith('.')]
-
-            for index, entry in enumerate(entries):
-                is_last = index == len(entries) - 1
-                connector = "└── " if is_last else "├── "
-                lines.append(f"{prefix}{connector}{entry.name}")
-
-                if entry.is_dir():
-                    extension = "    " if is_last else "│   "
-                    self._add_tree_entries(
-                        entry,
-                        lines,
-                        prefix + extension,
-                        max_depth,
-                        current_depth + 1,
-                        include_hidden
-                    )
-        except PermissionError:
-            pass
+            return entry.is_dir()
+        except OSError:
+            return False
+
+
+_CODE_SEARCH_METADATA = ToolMetadata(
+    name="code_search",
+    description="Fast code search with ripgrep (optimized for large codebases)",
+    parameters=(
+        _PATTERN_PARAM,
+        ToolParameter(
+            name="directory",
+            type=str,
+            description="Directory to search in",
+            required=False,
+            default="."
+        ),
+        ToolParameter(
+            name="file_pattern",
+            type=str,
+            description="File pattern filter",
+            required=False,
+            default=None
+        ),
+        ToolParameter(
+            name="case_sensitive",
+            type=bool,
+            description="Case-sensitive search",
+            required=False,
+            default=True
+        ),
+        ToolParameter(
+            name="max_results",
+            type=int,
+            description="Maximum number of results",
+            required=False,
+            default=None
+        ),
+        ToolParameter(
+            name="context_lines",
+            type=int,
+            description="Lines of context around matches",
+            required=False,
+            default=2
+        ),
+        ToolParameter(
+            name="threads",
+            type=int,
+            description="Number of ripgrep worker threads (default: ripgrep's choice)",
+            required=False,
+            default=None
+        ),
+        ToolParameter(
+            name="split_mode",
+            type=str,
+            description="'auto' for one ripgrep run, 'subtree' to search each top-level directory in parallel",
+            required=False,
+            default="auto"
+        )
+    ),
+    category="search"
+)
 
 
 class CodeSearchTool(Tool):
@@ -273,55 +461,7 @@ class CodeSearchTool(Tool):
     Optimized for large codebases.
     """
 
-    def _define_metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name="code_search",
-            description="Fast code search with ripgrep (optimized for large codebases)",
-            parameters=[
-                ToolParameter(
-                    name="pattern",
-                    type=str,
-                    description="Regex pattern to search for",
-                    required=True
-                ),
-                ToolParameter(
-                    name="directory",
-                    type=str,
-                    description="Directory to search in",
-                    required=False,
-                    default="."
-                ),
-                ToolParameter(
-                    name="file_pattern",
-                    type=str,
-                    description="File pattern filter",
-                    required=False,
-                    default=None
-                ),
-                ToolParameter(
-                    name="case_sensitive",
-                    type=bool,
-                    description="Case-sensitive search",
-                    required=False,
-                    default=True
-                ),
-                ToolParameter(
-                    name="max_results",
-                    type=int,
-                    description="Maximum number of results",
-                    required=False,
-                    default=None
-                ),
-                ToolParameter(
-                    name="context_lines",
-                    type=int,
-                    description="Lines of context around matches",
-                    required=False,
-                    default=2
-                )
-            ],
-            category="search"
-        )
+    _METADATA = _CODE_SEARCH_METADATA
 
     def execute(
         self,
@@ -330,7 +470,9 @@ class CodeSearchTool(Tool):
         file_pattern: str = None,
         case_sensitive: bool = True,
         max_results: int = None,
-        context_lines: int = 2
+        context_lines: int = 2,
+        threads: int = None,
+        split_mode: str = "auto"
     ) -> List[Dict[str, Any]]:
         """
         Execute code search
@@ -342,15 +484,20 @@ class CodeSearchTool(Tool):
             case_sensitive: Case sensitivity
             max_results: Maximum results
             context_lines: Context lines
+            threads: Ripgrep worker threads
+            split_mode: "auto" or "subtree"
 
         Returns:
             List of search results with context
         """
+        from tools import search
         return search.code_search(
             pattern,
             directory,
             file_pattern,
             case_sensitive,
             max_results,
-            context_lines
+            context_lines,
+            threads,
+            split_mode
         )
@@ -4,23 +4,106 @@ Search operations for agent system
 Provides file search (glob) and content search (grep) capabilities.
 """
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import fnmatch
+import json
+import os
 import re
+import stat
 import glob as glob_module
 
 from core.logger import logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Wall-clock limit for a single ripgrep run, in seconds
+_RIPGREP_TIMEOUT = 60
+
+# Parser for ripgrep's JSON lines, read as bytes; chosen once at import:
+# orjson when installed, the standard library otherwise
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Worker threads reading and scanning files in grep_content
+_GREP_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Files handed to a grep worker per task
+_GREP_BATCH_SIZE = 32
+
+# Files up to this size (bytes) are grepped as a whole instead of line by line
+_WHOLE_FILE_SCAN_LIMIT = 32 * 1024 * 1024
+
+# Regex syntax that may match a newline or depend on what precedes a line
+# (non-word escapes other than \w \d \b \B, negated classes, lookbehind,
+# inline flags, control characters); patterns using any of it are always
+# matched line by line
+_CROSS_LINE_SYNTAX = re.compile(r"\\[^\WwdbB]|\[\^|\(\?(?![:=!P])|[\x00-\x1f]")
+
 
 class SearchError(Exception):
     """Base exception for search errors"""
     pass
 
 
+def compile_pattern(pattern: str, case_sensitive: bool = True) -> re.Pattern:
+    """
+    Compile a search regex (cached)
+
+    Args:
+        pattern: Regex pattern
+        case_sensitive: Case-sensitive matching
+
+    Returns:
+        Compiled pattern
+
+    Raises:
+        SearchError: Invalid pattern
+    """
+    try:
+        return _compile_regex(pattern, 0 if case_sensitive else re.IGNORECASE)
+    except re.error as e:
+        raise SearchError(f"Invalid regex pattern '{pattern}': {e}")
+
+
+@lru_cache(maxsize=256)
+def _compile_regex(pattern: str, flags: int) -> re.Pattern:
+    """Compile regex, memoized by (pattern, flags)"""
+    return re.compile(pattern, flags)
+
+
+def _whole_text_regex(pattern: str, flags: int) -> Optional[re.Pattern]:
+    """
+    Get a MULTILINE variant of a pattern for matching whole file texts
+
+    A match found in the whole text then lies within a single line and
+    is also found by searching that line alone.
+
+    Args:
+        pattern: Pattern source
+        flags: Flags of the compiled pattern
+
+    Returns:
+        Compiled pattern, or None if the pattern may match across lines
+    """
+    if flags & (re.DOTALL | re.VERBOSE) or _CROSS_LINE_SYNTAX.search(pattern):
+        return None
+    return _compile_regex(pattern, flags | re.MULTILINE)
+
+
 def glob_files(
     pattern: str,
     path: str = ".",
-    recursive: bool = True
+    recursive: bool = True,
+    stat_cache: Optional[Dict[str, os.stat_result]] = None
 ) -> List[str]:
     """
     Find files matching pattern
@@ -29,6 +112,8 @@ def glob_files(
         pattern: Glob pattern (e.g., "*.py", "src/**/*.js")
         path: Directory to search in
         recursive: Enable recursive search
+        stat_cache: Optional path -> stat result mapping shared across
+            calls; matches found in it are not stat'ed again
 
     Returns:
         List of matching file paths
@@ -39,6 +124,16 @@ def glob_files(
         raise SearchError(f"Path not found: {path}")
 
     try:
+        # Recursive searches for a plain (non-hidden) file name pattern
+        # take the single scandir walk; anything else goes through glob
+        name_pattern = pattern[3:] if pattern.startswith('**/') else pattern
+        if recursive and _is_plain_name_pattern(name_pattern):
+            return _walk_matching_files(
+                str(base_path),
+                _pattern_matcher(name_pattern),
+                stat_cache
+            )
+
         # Build full pattern
         if recursive and '**' not in pattern:
             full_pattern = str(base_path / '**' / pattern)
@@ -48,37 +143,161 @@ def glob_files(
         # Search for files
         matches = glob_module.glob(full_pattern, recursive=recursive)
 
-        # Filter to files only (not directories)
-        files = [f for f in matches if Path(f).is_file()]
+        # One stat per match serves both the file filter and the sort key
+        mtimes = {}
+        for match in matches:
+            st = _stat_path(match, stat_cache)
+            if st is not None and stat.S_ISREG(st.st_mode):
+                mtimes[match] = st.st_mtime
 
         # Sort by modification time (most recent first)
-        files.sort(key=lambda x: Path(x).stat().st_mtime, reverse=True)
-        return files
+        return sorted(mtimes, key=mtimes.__getitem__, reverse=True)
 
     except Exception as e:
         raise SearchError(f"Glob search failed: {e}")
 
 
+def _is_plain_name_pattern(pattern: str) -> bool:
+    """
+    Check whether a glob pattern only matches file names
+
+    Such patterns can be matched during a directory walk. Hidden-name
+    patterns are excluded: the walk skips hidden entries.
+
+    Args:
+        pattern: Glob pattern
+
+    Returns:
+        True for non-empty patterns without path components or '**' that
+        do not start with '.'
+    """
+    return bool(pattern) and not (
+        '/' in pattern or os.sep in pattern or '**' in pattern
+        or pattern.startswith('.')
+    )
+
+
+def _stat_path(
+    file_path: str,
+    stat_cache: Optional[Dict[str, os.stat_result]]
+) -> Optional[os.stat_result]:
+    """
+    Stat a path, consulting and filling an optional cache
+
+    Args:
+        file_path: Path to stat
+        stat_cache: Optional cache mapping
+
+    Returns:
+        Stat result, or None if the path vanished or cannot be stat'ed
+    """
+    if stat_cache is not None:
+        st = stat_cache.get(file_path)
+        if st is not None:
+            return st
+
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+
+    if stat_cache is not None:
+        stat_cache[file_path] = st
+    return st
+
+
+@lru_cache(maxsize=128)
+def _pattern_matcher(pattern: Optional[str]) -> Callable[[str], Any]:
+    """
+    Compile a file name glob into a match function (memoized)
+
+    Args:
+        pattern: Glob pattern (e.g., "*.py"), or None to match everything
+
+    Returns:
+        Callable taking a file name, truthy on match
+    """
+    if not pattern:
+        return lambda name: True
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+def _walk_matching_files(
+    base_path: str,
+    matcher: Callable[[str], Any],
+    stat_cache: Optional[Dict[str, os.stat_result]] = None
+) -> List[str]:
+    """
+    Collect files under base_path whose name matches, newest first
+
+    Same selection as a recursive glob for "**/<pattern>" (hidden entries
+    skipped), but in one scandir walk that reuses directory entry types
+    and stats each candidate once. Symlinked directories are not
+    followed.
+
+    Args:
+        base_path: Directory to walk
+        matcher: File name match function
+        stat_cache: Optional path -> stat result mapping shared across
+            calls (see glob_files)
+
+    Returns:
+        Matching file paths sorted by modification time (most recent first)
+    """
+    mtimes = {}
+    stack = [base_path]
+
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif matcher(entry.name) and entry.is_file():
+                            st = stat_cache.get(entry.path) if stat_cache is not None else None
+                            if st is None:
+                                st = entry.stat()
+                                if stat_cache is not None:
+                                    stat_cache[entry.path] = st
+                            mtimes[entry.path] = st.st_mtime
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+    return sorted(mtimes, key=mtimes.__getitem__, reverse=True)
+
+
 def grep_content(
-    pattern: str,
+    pattern: Union[str, re.Pattern],
     path: str = ".",
     file_pattern: Optional[str] = None,
     case_sensitive: bool = True,
     output_mode: str = "files_with_matches",
     context_lines: int = 0,
-    max_results: Optional[int] = None
+    max_results: Optional[int] = None,
+    count_matches: bool = True
 ) -> Dict[str, Any]:
     """
     Search file contents for pattern
 
     Args:
-        pattern: Regex pattern to search for
+        pattern: Regex pattern to search for, or an already compiled
+            pattern (case_sensitive is then ignored)
         path: Directory to search in
         file_pattern: Glob pattern for files to search (e.g., "*.py")
         case_sensitive: Case-sensitive search
         output_mode: "files_with_matches", "content", or "count"
         context_lines: Lines of context around matches
         max_results: Maximum number of results
+        count_matches: With "files_with_matches", set to False when only
+            the file list is needed: each file is then only scanned up to
+            its first match (matches_found and match_counts count at most
+            one match per file)
 
     Returns:
         Dictionary with search results
@@ -89,18 +308,25 @@ def grep_content(
         raise SearchError(f"Path not found: {path}")
 
     try:
-        # Compile regex
-        flags = 0 if case_sensitive else re.IGNORECASE
-        regex = re.compile(pattern, flags)
+        if isinstance(pattern, re.Pattern):
+            regex = pattern
+        else:
+            regex = compile_pattern(pattern, case_sensitive)
 
-        # Get files to search
-        if file_pattern:
+        # Get files to search: plain name patterns are matched during a
+        # single directory walk; patterns with a path component or a
+        # hidden name ('.env', '.*') need glob, as the walk skips hidden
+        # entries
+        if file_pattern and not _is_plain_name_pattern(file_pattern):
             files = glob_files(file_pattern, str(base_path))
         else:
-            files = glob_files("*", str(base_path))
+            files = _walk_matching_files(
+                str(base_path),
+                _pattern_matcher(file_pattern)
+            )
 
         results = {
-            "pattern": pattern,
+            "pattern": regex.pattern,
             "files_searched": 0,
             "matches_found": 0,
             "files_with_matches": [],
@@ -108,31 +334,37 @@ def grep_content(
             "match_counts": {}
         }
 
-        for file_path in files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
+        scan_context = context_lines if output_mode == "content" else None
+        max_count = None
+        if output_mode == "files_with_matches" and not count_matches:
+            max_count = 1
+        text_regex = None
+        if isinstance(regex.pattern, str):
+            text_regex = _whole_text_regex(regex.pattern, regex.flags)
+
+        def scan_batch(batch: List[str]) -> List[Tuple[str, Any]]:
+            return [
+                (file_path, _scan_file(file_path, regex, text_regex, scan_context, max_count))
+                for file_path in batch
+            ]
+
+        # Files are read and scanned on worker threads, a batch per task to
+        # keep scheduling overhead low; results are consumed in file order,
+        # so the output does not depend on timing
+        batches = [
+            files[i:i + _GREP_BATCH_SIZE]
+            for i in range(0, len(files), _GREP_BATCH_SIZE)
+        ]
+        workers = max(1, min(_GREP_MAX_WORKERS, len(batches)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for file_path, scanned in chain.from_iterable(executor.map(scan_batch, batches)):
+                if scanned is None:
+                    # Binary or unreadable file
+                    continue
+                match_count, file_matches = scanned
 
                 results["files_searched"] += 1
-                file_matches = []
-                match_count = 0
-
-                for line_num, line in enumerate(lines, 1):
-                    if regex.search(line):
-                        match_count += 1
-                        results["matches_found"] += 1
-
-                        if output_mode == "content":
-                            # Include context lines
-                            start = max(0, line_num - context_lines - 1)
-                            end = min(len(lines), line_num + context_lines)
-                            context = lines[start:end]
-
-                            file_matches.append({
-                                "line_number": line_num,
-                                "line": line.rstrip(),
-                                "context": [l.rstrip() for l in context]
-                            })
+                results["matches_found"] += match_count
 
                 if match_count > 0:
                     results["files_with_matches"].append(file_path)
@@ -146,25 +378,200 @@ def grep_content(
 
                 # Stop if max results reached
                 if max_results and len(results["files_with_matches"]) >= max_results:
+                    executor.shutdown(wait=False, cancel_futures=True)
                     break
 
-            except UnicodeDecodeError:
-                # Skip binary files
-                continue
-            except Exception as e:
-                continue
         return results
 
     except Exception as e:
         raise SearchError(f"Grep search failed: {e}")
 
 
+def _scan_file(
+    file_path: str,
+    regex: re.Pattern,
+    text_regex: Optional[re.Pattern],
+    context_lines: Optional[int],
+    max_count: Optional[int] = None
+) -> Optional[Tuple[int, List[Dict[str, Any]]]]:
+    """
+    Scan one file for grep_content
+
+    Args:
+        file_path: File to scan
+        regex: Compiled pattern
+        text_regex: Whole-text variant of regex, or None to scan line by line
+        context_lines: Lines of context around matches, or None to only
+            count matches
+        max_count: Stop after this many matching lines (counting only)
+
+    Returns:
+        (match count, match entries), or None if the file is binary or
+        cannot be read
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            if (text_regex is not None and
+                    os.fstat(f.fileno()).st_size <= _WHOLE_FILE_SCAN_LIMIT):
+                return _scan_text(f.read(), text_regex, context_lines, max_count)
+            return _scan_lines(f, regex, context_lines, max_count)
+    except UnicodeDecodeError:
+        # Skip binary files
+        return None
+    except Exception:
+        return None
+
+
+def _scan_lines(
+    lines: Iterable[str],
+    regex: re.Pattern,
+    context_lines: Optional[int],
+    max_count: Optional[int] = None
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Match lines in one streaming pass, collecting context on the fly
+
+    Keeps the last context_lines lines in a ring buffer for leading
+    context and extends still-open matches with trailing lines as they
+    are read, so the file is neither held in memory nor re-read.
+
+    Args:
+        lines: Line iterable (e.g. an open text file)
+        regex: Compiled pattern
+        context_lines: Lines of context around matches, or None to only
+            count matches
+        max_count: When only counting, stop after this many matching lines
+
+    Returns:
+        (match count, match entries with line_number/line/context)
+    """
+    match_count = 0
+
+    if context_lines is None:
+        for line in lines:
+            if regex.search(line):
+                match_count += 1
+                if match_count == max_count:
+                    break
+        return match_count, []
+
+    context_lines = max(0, context_lines)
+    before: Deque[str] = deque(maxlen=context_lines)
+    matches: List[Dict[str, Any]] = []
+    # [match entry, trailing lines still wanted]
+    open_matches: List[List[Any]] = []
+
+    for line_num, raw_line in enumerate(lines, 1):
+        line = raw_line.rstrip()
+
+        if open_matches:
+            for pending in open_matches:
+                pending[0]["context"].append(line)
+                pending[1] -= 1
+            open_matches = [pending for pending in open_matches if pending[1] > 0]
+
+        if regex.search(raw_line):
+            match_count += 1
+            entry = {
+                "line_number": line_num,
+                "line": line,
+                "context": [*before, line]
+            }
+            matches.append(entry)
+            if context_lines:
+                open_matches.append([entry, context_lines])
+
+        if context_lines:
+            before.append(line)
+
+    return match_count, matches
+
+
+def _scan_text(
+    text: str,
+    regex: re.Pattern,
+    context_lines: Optional[int],
+    max_count: Optional[int] = None
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Match a whole file text, jumping from match to match
+
+    Same results as _scan_lines over the text's lines, but the regex
+    engine skips non-matching lines itself instead of being called once
+    per line. After a match the search resumes at the next line, so
+    each matching line is counted once.
+
+    Args:
+        text: File contents (newlines normalized to \\n)
+        regex: Compiled pattern from _whole_text_regex
+        context_lines: Lines of context around matches, or None to only
+            count matches
+        max_count: When only counting, stop after this many matching lines
+
+    Returns:
+        (match count, match entries with line_number/line/context)
+    """
+    # A match at the very end of a newline-terminated text lies past the
+    # last line
+    end = len(text) if text and not text.endswith('\n') else len(text) - 1
+
+    # 0-based indexes of the matching lines
+    matched_lines: List[int] = []
+    line_index = 0
+    counted_to = 0
+    pos = 0
+
+    while True:
+        match = regex.search(text, pos)
+        if match is None or match.start() > end:
+            break
+
+        line_start = text.rfind('\n', 0, match.start()) + 1
+        line_index += text.count('\n', counted_to, line_start)
+        counted_to = line_start
+        matched_lines.append(line_index)
+        if context_lines is None and len(matched_lines) == max_count:
+            break
+
+        next_newline = text.find('\n', match.start())
+        if next_newline < 0:
+            break
+        pos = next_newline + 1
+
+    if context_lines is None or not matched_lines:
+        return len(matched_lines), []
+
+    context_lines = max(0, context_lines)
+    lines = text.split('\n')
+    if not lines[-1]:
+        lines.pop()
+
+    matches = []
+    for index in matched_lines:
+        context = [
+            line.rstrip()
+            for line in lines[max(0, index - context_lines):index + context_lines + 1]
+        ]
+        matches.append({
+            "line_number": index + 1,
+            "line": lines[index].rstrip(),
+            "context": context
+        })
+
+    return len(matched_lines), matches
+
+
+# Column names of list_directory results, in row order
+_LIST_COLUMNS = ("name", "path", "is_file", "is_dir", "size", "modified")
+
+
 def list_directory(
     path: str = ".",
     include_hidden: bool = False,
     files_only: bool = False,
-    dirs_only: bool = False
-) -> List[Dict[str, Any]]:
+    dirs_only: bool = False,
+    columnar: bool = False
+) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
     """
     List directory contents
 
@@ -173,9 +580,13 @@ def list_directory(
         include_hidden: Include hidden files (starting with .)
         files_only: List only files
         dirs_only: List only directories
+        columnar: Return one list per field instead of one dict per
+            entry (cheaper for large directories)
 
     Returns:
-        List of dictionaries with file/directory information
+        List of dictionaries with file/directory information, or with
+        columnar, a dictionary mapping each field to a list of values
+        (same order)
     """
     dir_path = Path(path).resolve()
 
@@ -186,33 +597,45 @@ def list_directory(
         raise SearchError(f"Not a directory: {path}")
 
     try:
-        items = []
-
-        for item in dir_path.iterdir():
-            # Skip hidden files if requested
-            if not include_hidden and item.name.startswith('.'):
-                continue
+        rows = []
+
+        # DirEntry type checks come from the directory listing itself;
+        # stat() is called once per kept entry and serves size/mtime too
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                # Skip hidden files if requested
+                if not include_hidden and entry.name.startswith('.'):
+                    continue
 
-            # Apply filters
-            if files_only and not item.is_file():
-                continue
-            if dirs_only and not item.is_dir():
-                continue
+                # Apply filters
+                if files_only and not entry.is_file():
+                    continue
+                if dirs_only and not entry.is_dir():
+                    continue
 
-            stat = item.stat()
+                entry_stat = entry.stat()
+                is_file = stat.S_ISREG(entry_stat.st_mode)
 
-            items.append({
-                "name": item.name,
-                "path": str(item),
-                "is_file": item.is_file(),
-                "is_dir": item.is_dir(),
-                "size": stat.st_size if item.is_file() else 0,
-                "modified": stat.st_mtime
-            })
+                rows.append((
+                    entry.name,
+                    entry.path,
+                    is_file,
+                    stat.S_ISDIR(entry_stat.st_mode),
+                    entry_stat.st_size if is_file else 0,
+                    entry_stat.st_mtime
+                ))
 
         # Sort: directories first, then by name
-        items.sort(key=lambda x: (not x["is_dir"], x["name"].lower()))
-        return items
+        rows.sort(key=lambda row: (not row[3], row[0].lower()))
+
+        if columnar:
+            columns = list(zip(*rows)) or [()] * len(_LIST_COLUMNS)
+            return {
+                name: list(values)
+                for name, values in zip(_LIST_COLUMNS, columns)
+            }
+
+        return [dict(zip(_LIST_COLUMNS, row)) for row in rows]
 
     except Exception as e:
         raise SearchError(f"Failed to list directory: {e}")
@@ -244,15 +667,17 @@ def find_files_by_content(
         path=path,
         file_pattern=file_pattern,
         case_sensitive=case_sensitive,
-        output_mode="files_with_matches"
+        output_mode="files_with_matches",
+        count_matches=False
     )
 
     return results["files_with_matches"]
 
 
+@lru_cache(maxsize=1)
 def _is_ripgrep_available() -> bool:
     """
-    Check if ripgrep is available
+    Check if ripgrep is available (looked up once per process)
 
     Returns:
         True if ripgrep is installed
@@ -267,7 +692,9 @@ def _build_ripgrep_command(
     file_pattern: Optional[str],
     case_sensitive: bool,
     max_results: Optional[int],
-    context_lines: int
+    context_lines: int,
+    threads: Optional[int] = None,
+    max_depth: Optional[int] = None
 ) -> List[str]:
     """
     Build ripgrep command arguments
@@ -279,12 +706,20 @@ def _build_ripgrep_command(
         case_sensitive: Case sensitivity flag
         max_results: Maximum results limit
         context_lines: Context lines count
+        threads: Number of ripgrep worker threads (-j)
+        max_depth: Maximum directory depth to descend
 
     Returns:
         Command arguments list
     """
     cmd = ["rg", "--json"]
 
+    if threads:
+        cmd.extend(["-j", str(threads)])
+
+    if max_depth is not None:
+        cmd.extend(["--max-depth", str(max_depth)])
+
     if not case_sensitive:
         cmd.append("-i")
 
@@ -342,36 +777,104 @@ def _parse_ripgrep_context(data: Dict[str, Any]) -> str:
     return context_data.get("lines", {}).get("text", "").rstrip()
 
 
-def _execute_ripgrep(cmd: List[str]) -> str:
+def _iter_ripgrep_files(cmd: List[str]) -> Iterator[Dict[str, Any]]:
     """
-    Execute ripgrep command
+    Run ripgrep and yield its matches grouped by file, as they arrive
+
+    ripgrep's --json stream is parsed line by line from the pipe, so
+    memory stays bounded by one file's matches and the first file is
+    available before the search finishes. Lines are parsed straight from
+    bytes (ripgrep's JSON is always valid UTF-8), skipping a text decoding
+    layer. Closing the generator early terminates ripgrep.
 
     Args:
-        cmd: Command arguments
+        cmd: Command arguments (with --json)
 
-    Returns:
-        Command output
+    Yields:
+        {"file": path, "matches": [{"line_number", "line", "context"}]}
 
     Raises:
-        SearchError: Execution failed
+        SearchError: Execution failed or timed out
     """
     import subprocess
+    import threading
 
     try:
-        result = subprocess.run(
+        process = subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
-            timeout=60
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
         )
-        return result.stdout
-
-    except subprocess.TimeoutExpired:
-        raise SearchError("Code search timeout")
-
     except Exception as e:
         raise SearchError(f"Ripgrep execution failed: {e}")
 
+    timed_out = threading.Event()
+
+    def on_timeout():
+        timed_out.set()
+        process.kill()
+
+    timer = threading.Timer(_RIPGREP_TIMEOUT, on_timeout)
+    timer.daemon = True
+    timer.start()
+
+    current_file = None
+    current_matches: List[Dict[str, Any]] = []
+
+    try:
+        for line in process.stdout:
+            if not line.strip():
+                continue
+
+            try:
+                data = _json_loads(line)
+            except ValueError:
+                continue
+
+            data_type = data.get("type")
+
+            if data_type == "match":
+                match_info = _parse_ripgrep_match(data)
+                if not match_info:
+                    continue
+
+                if match_info["file_path"] != current_file:
+                    if current_matches:
+                        yield {"file": current_file, "matches": current_matches}
+                    current_file = match_info["file_path"]
+                    current_matches = []
+
+                current_matches.append({
+                    "line_number": match_info["line_number"],
+                    "line": match_info["line"],
+                    "context": []
+                })
+
+            elif data_type == "context":
+                if current_matches:
+                    current_matches[-1]["context"].append(_parse_ripgrep_context(data))
+
+            elif data_type == "end":
+                if current_matches:
+                    yield {"file": current_file, "matches": current_matches}
+                current_file = None
+                current_matches = []
+
+        if current_matches:
+            yield {"file": current_file, "matches": current_matches}
+
+        process.wait()
+
+    finally:
+        timer.cancel()
+        if process.poll() is None:
+            process.terminate()
+            process.wait()
+        process.stdout.close()
+
+    if timed_out.is_set():
+        raise SearchError("Code search timeout")
+
 
 def _create_empty_search_results(pattern: str) -> Dict[str, Any]:
     """
@@ -392,85 +895,71 @@ def _create_empty_search_results(pattern: str) -> Dict[str, Any]:
     }
 
 
-def _process_ripgrep_output(output: str, pattern: str) -> Dict[str, Any]:
+def _collect_ripgrep_results(cmd: List[str], pattern: str) -> Dict[str, Any]:
     """
-    Process ripgrep JSON output
+    Run ripgrep and build the results dictionary
 
     Args:
-        output: Ripgrep JSON output
+        cmd: Command arguments
         pattern: Search pattern
 
     Returns:
         Search results dictionary
     """
-    import json
-
     results = _create_empty_search_results(pattern)
-    current_file = None
-    current_matches = []
-    files_seen = set()
-
-    for line in output.splitlines():
-        if not line.strip():
-            continue
 
-        try:
-            data = json.loads(line)
-            data_type = data.get("type")
+    with closing(_iter_ripgrep_files(cmd)) as file_matches:
+        for entry in file_matches:
+            results["files_with_matches"].append(entry["file"])
+            results["content_matches"].append(entry)
+            results["matches_found"] += len(entry["matches"])
 
-            if data_type == "match":
-                match_info = _parse_ripgrep_match(data)
-                if not match_info:
-                    continue
-
-                file_path = match_info["file_path"]
-
-                if file_path not in files_seen:
-                    _finalize_file_matches(results, current_file, current_matches)
-                    files_seen.add(file_path)
-                    results["files_with_matches"].append(file_path)
-                    current_file = file_path
-                    current_matches = []
-
-                current_matches.append({
-                    "line_number": match_info["line_number"],
-                    "line": match_info["line"],
-                    "context": []
-                })
-                results["matches_found"] += 1
-
-            elif data_type == "context":
-                context_line = _parse_ripgrep_context(data)
-                if current_matches:
-                    current_matches[-1]["context"].append(context_line)
+    results["files_searched"] = len(results["files_with_matches"])
+    return results
 
-        except json.JSONDecodeError:
-            continue
 
-    _finalize_file_matches(results, current_file, current_matches)
-    results["files_searched"] = len(files_seen)
+def iter_code_search_ripgrep(
+    pattern: str,
+    path: str = ".",
+    file_pattern: Optional[str] = None,
+    case_sensitive: bool = True,
+    max_results: Optional[int] = None,
+    context_lines: int = 2,
+    threads: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Search code using ripgrep, yielding results file by file
 
-    return results
+    Args:
+        pattern: Regex pattern
+        path: Directory path
+        file_pattern: File pattern filter
+        case_sensitive: Case sensitivity
+        max_results: Maximum matches per file
+        context_lines: Context lines
+        threads: Number of ripgrep worker threads
 
+    Returns:
+        Iterator of {"file", "matches"} entries; close it to stop ripgrep
 
-def _finalize_file_matches(
-    results: Dict[str, Any],
-    current_file: Optional[str],
-    current_matches: List[Dict[str, Any]]
-):
+    Raises:
+        SearchError: Search failed
     """
-    Finalize matches for current file
+    base_path = Path(path).resolve()
 
-    Args:
-        results: Results dictionary to update
-        current_file: Current file path
-        current_matches: Current file matches
-    """
-    if current_file and current_matches:
-        results["content_matches"].append({
-            "file": current_file,
-            "matches": current_matches
-        })
+    if not base_path.exists():
+        raise SearchError(f"Path not found: {path}")
+
+    cmd = _build_ripgrep_command(
+        pattern,
+        str(base_path),
+        file_pattern,
+        case_sensitive,
+        max_results,
+        context_lines,
+        threads
+    )
+    return _iter_ripgrep_files(cmd)
 
 
 def code_search_ripgrep(
@@ -479,7 +968,8 @@ def code_search_ripgrep(
     file_pattern: Optional[str] = None,
     case_sensitive: bool = True,
     max_results: Optional[int] = None,
-    context_lines: int = 2
+    context_lines: int = 2,
+    threads: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Search code using ripgrep
@@ -489,8 +979,9 @@ def code_search_ripgrep(
         path: Directory path
         file_pattern: File pattern filter
         case_sensitive: Case sensitivity
-        max_results: Maximum results
+        max_results: Maximum matches per file
         context_lines: Context lines
+        threads: Number of ripgrep worker threads
 
     Returns:
         Search results dictionary
@@ -509,11 +1000,156 @@ def code_search_ripgrep(
         file_pattern,
         case_sensitive,
         max_results,
-        context_lines
+        context_lines,
+        threads
     )
 
-    output = _execute_ripgrep(cmd)
-    results = _process_ripgrep_output(output, pattern)
+    return _collect_ripgrep_results(cmd, pattern)
+
+
+def code_search_subtrees(
+    pattern: str,
+    path: str = ".",
+    file_pattern: Optional[str] = None,
+    case_sensitive: bool = True,
+    max_results: Optional[int] = None,
+    context_lines: int = 2,
+    threads: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Search code with one ripgrep process per top-level subtree
+
+    Files directly under path are searched by one extra process. Hidden,
+    symlinked and git-ignored top-level directories are skipped, as a
+    single ripgrep run would skip them.
+
+    Args:
+        pattern: Regex pattern
+        path: Directory path
+        file_pattern: File pattern filter
+        case_sensitive: Case sensitivity
+        max_results: Maximum matches per file
+        context_lines: Context lines
+        threads: Total number of ripgrep threads to spread over processes
+
+    Returns:
+        Merged search results dictionary
+
+    Raises:
+        SearchError: Search failed
+    """
+    base_path = Path(path).resolve()
+
+    if not base_path.exists():
+        raise SearchError(f"Path not found: {path}")
+
+    if not base_path.is_dir():
+        return code_search_ripgrep(
+            pattern, path, file_pattern, case_sensitive,
+            max_results, context_lines, threads
+        )
+
+    subtrees = _list_search_subtrees(base_path)
+    total_threads = threads or os.cpu_count() or 1
+    workers = max(1, min(total_threads, len(subtrees) + 1))
+    worker_threads = max(1, total_threads // workers)
+
+    # (path, max_depth): the root itself is limited to its direct files
+    targets = [(str(base_path), 1)] + [(subtree, None) for subtree in subtrees]
+
+    def search_target(target) -> Dict[str, Any]:
+        target_path, max_depth = target
+        cmd = _build_ripgrep_command(
+            pattern,
+            target_path,
+            file_pattern,
+            case_sensitive,
+            max_results,
+            context_lines,
+            worker_threads,
+            max_depth
+        )
+        return _collect_ripgrep_results(cmd, pattern)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        partials = list(executor.map(search_target, targets))
+
+    return _merge_search_results(pattern, partials)
+
+
+def _list_search_subtrees(base_path: Path) -> List[str]:
+    """
+    List top-level directories a ripgrep run over base_path would enter
+
+    Args:
+        base_path: Resolved directory path
+
+    Returns:
+        Sorted directory paths
+    """
+    with os.scandir(base_path) as entries:
+        names = sorted(
+            entry.name for entry in entries
+            if not entry.name.startswith('.')
+            and entry.is_dir(follow_symlinks=False)
+        )
+
+    ignored = _git_ignored_names(base_path, names)
+    return [str(base_path / name) for name in names if name not in ignored]
+
+
+def _git_ignored_names(base_path: Path, names: List[str]) -> set:
+    """
+    Return the entries of base_path that git ignores
+
+    Args:
+        base_path: Directory containing the entries
+        names: Entry names to check
+
+    Returns:
+        Set of ignored names (empty outside a git repository)
+    """
+    import subprocess
+
+    if not names:
+        return set()
+
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(base_path), "check-ignore", "--", *names],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return set()
+
+    return {line.rstrip('/') for line in result.stdout.splitlines()}
+
+
+def _merge_search_results(
+    pattern: str,
+    partials: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Merge ripgrep results of disjoint searches
+
+    Args:
+        pattern: Search pattern
+        partials: Results dictionaries to merge, in order
+
+    Returns:
+        Merged results dictionary
+    """
+    results = _create_empty_search_results(pattern)
+
+    for partial in partials:
+        for entry in partial["content_matches"]:
+            results["files_with_matches"].append(entry["file"])
+            results["content_matches"].append(entry)
+            results["matches_found"] += len(entry["matches"])
+
+    results["files_searched"] = len(results["files_with_matches"])
     return results
 
 
@@ -523,7 +1159,9 @@ def code_search(
     file_pattern: Optional[str] = None,
     case_sensitive: bool = True,
     max_results: Optional[int] = None,
-    context_lines: int = 2
+    context_lines: int = 2,
+    threads: Optional[int] = None,
+    split_mode: str = "auto"
 ) -> Dict[str, Any]:
     """
     Search code with automatic ripgrep fallback
@@ -535,19 +1173,30 @@ def code_search(
         case_sensitive: Case sensitivity
         max_results: Maximum results
         context_lines: Context lines
+        threads: Number of ripgrep worker threads
+        split_mode: "auto" (single ripgrep run) or "subtree" (one
+            ripgrep process per top-level directory)
 
     Returns:
         Search results dictionary
     """
+    if split_mode not in ("auto", "subtree"):
+        raise SearchError(f"Invalid split_mode: {split_mode}")
+
     if _is_ripgrep_available():
+        search_func = (
+            code_search_subtrees if split_mode == "subtree"
+            else code_search_ripgrep
+        )
         try:
-            return code_search_ripgrep(
+            return search_func(
                 pattern,
                 path,
                 file_pattern,
                 case_sensitive,
                 max_results,
-                context_lines
+                context_lines,
+                threads
             )
         except SearchError as e:
             pass
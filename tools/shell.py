@@ -4,10 +4,14 @@ Shell command execution for agent system
 Provides safe command execution with timeout, output capture, and process management.
 """
 
+from functools import lru_cache
 from pathlib import Path
+import asyncio
+import shutil
 import subprocess
+import shlex
 import os
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Union
 import time
 
 from core.logger import logger
@@ -28,6 +32,29 @@ class CommandExecutionError(ShellError):
     pass
 
 
+# Characters that give a command string meaning beyond plain words and
+# quoting (expansion, redirection, pipelines, globbing, comments, escapes)
+_SHELL_METACHARACTERS = frozenset("|&;<>()$`\\*?[]{}~#\n")
+
+# Words /bin/sh handles itself (POSIX special and regular builtins, common
+# dash/bash builtins, reserved words); PATH copies of e.g. echo, test or
+# kill behave differently, so commands starting with these keep the shell
+_SHELL_BUILTINS = frozenset({
+    # Special builtins
+    "break", ":", "continue", ".", "eval", "exec", "exit", "export",
+    "readonly", "return", "set", "shift", "times", "trap", "unset",
+    # Regular builtins
+    "alias", "bg", "cd", "command", "echo", "false", "fc", "fg", "getopts",
+    "hash", "jobs", "kill", "newgrp", "printf", "pwd", "read", "test", "[",
+    "true", "type", "ulimit", "umask", "unalias", "wait",
+    "builtin", "declare", "local", "let", "source", "typeset",
+    # Reserved words
+    "!", "{", "}", "[[", "]]", "case", "do", "done", "elif", "else", "esac",
+    "fi", "for", "function", "if", "in", "select", "then", "time", "until",
+    "while",
+})
+
+
 class ShellResult:
     """Result of shell command execution"""
 
@@ -54,8 +81,74 @@ class ShellResult:
         )
 
 
-def execute_command(
+@lru_cache(maxsize=256)
+def _split_plain_command(command: str) -> Optional[Tuple[str, ...]]:
+    """
+    Split a command made only of words and simple quoting (memoized)
+
+    Args:
+        command: Command string
+
+    Returns:
+        argv tuple, or None if the command needs a shell: metacharacters,
+        unbalanced quotes, a leading assignment, a shell builtin or
+        keyword, or a first word containing a path
+    """
+    if not _SHELL_METACHARACTERS.isdisjoint(command):
+        return None
+
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+
+    if (not argv or "=" in argv[0] or "/" in argv[0]
+            or argv[0] in _SHELL_BUILTINS):
+        return None
+
+    return tuple(argv)
+
+
+def _direct_argv(
     command: str,
+    env: Optional[Dict[str, str]] = None
+) -> Optional[Tuple[str, ...]]:
+    """
+    Get the argv to exec a shell command directly, when /bin/sh would add
+    nothing
+
+    Only the split is memoized: the executable is looked up on PATH on
+    every call, so a removed binary still gets the shell's 127 result.
+    Commands given an env override always go through the shell, which
+    resolves the executable with that environment.
+
+    Args:
+        command: Command string
+        env: Environment overrides of the call
+
+    Returns:
+        argv tuple, or None if the command needs a shell
+    """
+    if env:
+        return None
+
+    argv = _split_plain_command(command)
+    if argv is None:
+        return None
+
+    # Relative PATH entries would resolve against the child's cwd
+    search_path = os.environ.get("PATH", os.defpath)
+    if not all(os.path.isabs(entry) for entry in search_path.split(os.pathsep)):
+        return None
+
+    if shutil.which(argv[0], path=search_path) is None:
+        return None
+
+    return argv
+
+
+def execute_command(
+    command: Union[str, List[str]],
     cwd: Optional[str] = None,
     timeout: Optional[int] = 120,
     env: Optional[Dict[str, str]] = None,
@@ -66,11 +159,11 @@ def execute_command(
     Execute shell command
 
     Args:
-        command: Command to execute
+        command: Command string, or argv list executed without a shell
         cwd: Working directory (defaults to current)
         timeout: Timeout in seconds (None for no timeout)
         env: Environment variables (merges with current env)
-        shell: Execute through shell
+        shell: Execute through shell (ignored for argv lists)
         capture_output: Capture stdout/stderr
 
     Returns:
@@ -82,9 +175,24 @@ def execute_command(
     """
     start_time = time.time()
 
-    # Prepare environment
-    cmd_env = os.environ.copy()
+    # Argv lists are exec'd directly: no /bin/sh fork, no quoting
+    if isinstance(command, (list, tuple)):
+        argv = list(command)
+        command = shlex.join(argv)
+        shell = False
+    else:
+        argv = command
+        # Plain commands skip the shell too
+        if shell:
+            direct = _direct_argv(command, env)
+            if direct is not None:
+                argv = list(direct)
+                shell = False
+
+    # Prepare environment (None lets the child inherit ours without a copy)
+    cmd_env = None
     if env:
+        cmd_env = os.environ.copy()
         cmd_env.update(env)
 
     # Prepare working directory
@@ -95,7 +203,7 @@ def execute_command(
     try:
         # Execute command
         process = subprocess.Popen(
-            command,
+            argv,
             shell=shell,
             cwd=str(work_dir),
             env=cmd_env,
@@ -145,8 +253,103 @@ def execute_command(
         raise CommandExecutionError(f"Failed to execute command: {e}")
 
 
+async def execute_command_async(
+    command: Union[str, List[str]],
+    cwd: Optional[str] = None,
+    timeout: Optional[int] = 120,
+    env: Optional[Dict[str, str]] = None,
+    shell: bool = True
+) -> ShellResult:
+    """
+    Execute shell command without blocking the event loop
+
+    Same contract as execute_command (output is always captured), so
+    several commands can be awaited concurrently with asyncio.gather.
+
+    Args:
+        command: Command string, or argv list executed without a shell
+        cwd: Working directory (defaults to current)
+        timeout: Timeout in seconds (None for no timeout)
+        env: Environment variables (merges with current env)
+        shell: Execute through shell (ignored for argv lists)
+
+    Returns:
+        ShellResult with command output and status
+
+    Raises:
+        CommandTimeoutError: Command exceeded timeout
+        CommandExecutionError: Command failed to execute
+    """
+    start_time = time.time()
+
+    if isinstance(command, (list, tuple)):
+        argv = list(command)
+        command = shlex.join(argv)
+        shell = False
+    else:
+        argv = None
+        if shell:
+            direct = _direct_argv(command, env)
+            if direct is not None:
+                argv = list(direct)
+                shell = False
+
+    cmd_env = None
+    if env:
+        cmd_env = os.environ.copy()
+        cmd_env.update(env)
+
+    work_dir = Path(cwd).resolve() if cwd else Path.cwd()
+    if not work_dir.exists():
+        raise ShellError(f"Working directory not found: {cwd}")
+
+    try:
+        if shell:
+            process = await asyncio.create_subprocess_shell(
+                command,
+                cwd=str(work_dir),
+                env=cmd_env,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        else:
+            process = await asyncio.create_subprocess_exec(
+                *(argv if argv is not None else shlex.split(command)),
+                cwd=str(work_dir),
+                env=cmd_env,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise CommandTimeoutError(
+                f"Command exceeded timeout of {timeout}s: {command}"
+            )
+
+        return ShellResult(
+            command=command,
+            returncode=process.returncode,
+            stdout=stdout.decode(errors="replace"),
+            stderr=stderr.decode(errors="replace"),
+            execution_time=time.time() - start_time
+        )
+
+    except CommandTimeoutError:
+        raise
+
+    except FileNotFoundError:
+        raise CommandExecutionError(f"Command not found: {command}")
+
+    except Exception as e:
+        raise CommandExecutionError(f"Failed to execute command: {e}")
+
+
 def run_command(
-    command: str,
+    command: Union[str, List[str]],
     cwd: Optional[str] = None,
     timeout: Optional[int] = 120,
     env: Optional[Dict[str, str]] = None,
@@ -156,7 +359,7 @@ def run_command(
     Run command and return result
 
     Args:
-        command: Command to execute
+        command: Command string, or argv list executed without a shell
         cwd: Working directory
         timeout: Timeout in seconds
         env: Environment variables
@@ -177,7 +380,7 @@ def run_command(
 
     if check and not result.success:
         raise CommandExecutionError(
-            f"Command failed with code {result.returncode}: {command}\n"
+            f"Command failed with code {result.returncode}: {result.command}\n"
             f"stderr: {result.stderr}"
         )
 
@@ -5,14 +5,16 @@ Provides a unified interface for all agent tools with parameter validation,
 execution tracking, and a central registry.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import cached_property
+import asyncio
 
 from core.logger import logger
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolParameter:
     """Tool parameter definition"""
     name: str
@@ -22,12 +24,12 @@ class ToolParameter:
     default: Any = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolMetadata:
-    """Tool metadata"""
+    """Tool metadata (immutable, shared by all instances of a tool class)"""
     name: str
     description: str
-    parameters: List[ToolParameter] = field(default_factory=list)
+    parameters: Tuple[ToolParameter, ...] = ()
     category: str = "general"
     dangerous: bool = False
 
@@ -47,28 +49,83 @@ class ToolValidationError(ToolError):
     pass
 
 
+def _compile_parameters(
+    metadata: ToolMetadata
+) -> Tuple[Tuple[str, ...], Dict[str, type], Dict[str, Any]]:
+    """
+    Precompute the parameter tables used by Tool.validate_parameters
+
+    Args:
+        metadata: Tool metadata
+
+    Returns:
+        (required names in order, name -> type, name -> non-None default)
+    """
+    required = tuple(p.name for p in metadata.parameters if p.required)
+    types = {p.name: p.type for p in metadata.parameters}
+    defaults = {
+        p.name: p.default for p in metadata.parameters
+        if p.default is not None
+    }
+    return required, types, defaults
+
+
+# Tool subclasses, in definition order (filled by Tool.__init_subclass__)
+_tool_classes: List[Type["Tool"]] = []
+
+
 class Tool(ABC):
     """
     Base class for all tools
 
     Tools provide specific capabilities to agents (file operations,
     search, shell commands, etc.). Each tool must implement execute()
-    and define metadata.
+    and define metadata, normally as the class attribute _METADATA.
     """
 
+    # Metadata shared by all instances (set in each tool's class body)
+    _METADATA: Optional[ToolMetadata] = None
+
+    # Parameter tables derived from the metadata once, not per call
+    _required: Tuple[str, ...] = ()
+    _types: Dict[str, type] = {}
+    _defaults: Dict[str, Any] = {}
+
+    def __init_subclass__(cls, register: bool = True, **kwargs):
+        """
+        Record concrete tool classes as they are defined
+
+        Args:
+            register: Set to False (class Foo(Tool, register=False)) for
+                base classes that must not be instantiated as tools
+        """
+        super().__init_subclass__(**kwargs)
+        if cls._METADATA is not None:
+            cls._required, cls._types, cls._defaults = _compile_parameters(
+                cls._METADATA
+            )
+        if register:
+            _tool_classes.append(cls)
+
     def __init__(self):
         self._metadata = self._define_metadata()
         self._validate_metadata()
+        if self._metadata is not type(self)._METADATA:
+            self._required, self._types, self._defaults = _compile_parameters(
+                self._metadata
+            )
 
-    @abstractmethod
     def _define_metadata(self) -> ToolMetadata:
         """
         Define tool metadata
 
+        Defaults to the class-level _METADATA; override only when the
+        metadata depends on the instance.
+
         Returns:
             ToolMetadata instance
         """
-        pass
+        return type(self)._METADATA
 
     @abstractmethod
     def execute(self, **kwargs) -> Any:
@@ -86,8 +143,25 @@ class Tool(ABC):
         """
         pass
 
+    async def aexecute(self, **kwargs) -> Any:
+        """
+        Execute tool without blocking the event loop
+
+        Runs execute() in a worker thread; tools with native async I/O
+        override this.
+
+        Args:
+            **kwargs: Tool parameters
+
+        Returns:
+            Tool execution result
+        """
+        return await asyncio.to_thread(self.execute, **kwargs)
+
     def _validate_metadata(self):
         """Validate metadata is properly defined"""
+        if self._metadata is None:
+            raise ToolError(f"{type(self).__name__} defines no metadata")
         if not self._metadata.name:
             raise ToolError("Tool name not defined")
         if not self._metadata.description:
@@ -106,34 +180,30 @@ class Tool(ABC):
         Raises:
             ToolValidationError: Parameter validation failed
         """
-        validated = {}
-
         # Check all required parameters
-        for param_def in self._metadata.parameters:
-            if param_def.required and param_def.name not in params:
-                raise ToolValidationError(
-                    f"Missing required parameter: {param_def.name}"
-                )
-
-            # Get value or use default
-            if param_def.name in params:
-                value = params[param_def.name]
-
-                # Type checking (basic)
-                if value is not None and not isinstance(value, param_def.type):
-                    # Try to convert
-                    try:
-                        value = param_def.type(value)
-                    except (ValueError, TypeError):
-                        raise ToolValidationError(
-                            f"Invalid type for {param_def.name}: "
-                            f"expected {param_def.type.__name__}, "
-                            f"got {type(value).__name__}"
-                        )
-
-                validated[param_def.name] = value
-            elif param_def.default is not None:
-                validated[param_def.name] = param_def.default
+        for name in self._required:
+            if name not in params:
+                raise ToolValidationError(f"Missing required parameter: {name}")
+
+        validated = dict(self._defaults)
+        for name, param_type in self._types.items():
+            if name not in params:
+                continue
+            value = params[name]
+
+            # Type checking (basic)
+            if value is not None and not isinstance(value, param_type):
+                # Try to convert
+                try:
+                    value = param_type(value)
+                except (ValueError, TypeError):
+                    raise ToolValidationError(
+                        f"Invalid type for {name}: "
+                        f"expected {param_type.__name__}, "
+                        f"got {type(value).__name__}"
+                    )
+
+            validated[name] = value
 
         return validated
 
@@ -167,6 +237,33 @@ class Tool(ABC):
                 f"Tool {self._metadata.name} failed: {e}"
             )
 
+    async def arun(self, **kwargs) -> Any:
+        """
+        Async counterpart of run(), awaiting aexecute()
+
+        Args:
+            **kwargs: Tool parameters
+
+        Returns:
+            Tool execution result
+
+        Raises:
+            ToolValidationError: Parameter validation failed
+            ToolExecutionError: Execution failed
+        """
+        try:
+            validated_params = self.validate_parameters(kwargs)
+            return await self.aexecute(**validated_params)
+
+        except ToolValidationError:
+            raise
+        except ToolExecutionError:
+            raise
+        except Exception as e:
+            raise ToolExecutionError(
+                f"Tool {self._metadata.name} failed: {e}"
+            )
+
     @property
     def name(self) -> str:
         """Get tool name"""
@@ -187,6 +284,31 @@ class Tool(ABC):
         """Check if tool is dangerous"""
         return self._metadata.dangerous
 
+    @cached_property
+    def schema(self) -> Dict[str, Any]:
+        """
+        Get tool description dictionary
+
+        Built once from the (immutable) metadata and shared by all
+        callers; treat it as read-only.
+        """
+        return {
+            "name": self._metadata.name,
+            "description": self._metadata.description,
+            "category": self._metadata.category,
+            "dangerous": self._metadata.dangerous,
+            "parameters": [
+                {
+                    "name": p.name,
+                    "type": p.type.__name__,
+                    "description": p.description,
+                    "required": p.required,
+                    "default": p.default
+                }
+                for p in self._metadata.parameters
+            ]
+        }
+
 
 class ToolRegistry:
     """
@@ -221,6 +343,26 @@ class ToolRegistry:
             self._categories[category] = []
         self._categories[category].append(tool.name)
 
+    def register_many(self, tools: Iterable[Tool]):
+        """
+        Register several tools in one batch
+
+        Same semantics as register() (already registered names are kept),
+        but the registry dict is updated in a single call.
+
+        Args:
+            tools: Tool instances to register
+        """
+        new_tools: Dict[str, Tool] = {}
+        for tool in tools:
+            if tool.name not in self._tools and tool.name not in new_tools:
+                new_tools[tool.name] = tool
+
+        self._tools.update(new_tools)
+
+        for name, tool in new_tools.items():
+            self._categories.setdefault(tool.metadata.category, []).append(name)
+
     def unregister(self, tool_name: str):
         """
         Unregister a tool
@@ -322,6 +464,30 @@ class ToolRegistry:
 
         return tool.run(**kwargs)
 
+    async def aexecute(self, tool_name: str, **kwargs) -> Any:
+        """
+        Execute tool by name without blocking the event loop
+
+        Independent calls can be overlapped with asyncio.gather.
+
+        Args:
+            tool_name: Name of tool to execute
+            **kwargs: Tool parameters
+
+        Returns:
+            Tool execution result
+
+        Raises:
+            ToolError: Tool not found
+            ToolExecutionError: Execution failed
+        """
+        tool = self.get_tool(tool_name)
+        if not tool:
+            available = list(self._tools.keys())
+            raise ToolError(f"Tool '{tool_name}' not found. Available tools: {available}")
+
+        return await tool.arun(**kwargs)
+
     def get_tool_info(self, tool_name: str) -> Optional[Dict[str, Any]]:
         """
         Get tool information
@@ -336,22 +502,7 @@ class ToolRegistry:
         if not tool:
             return None
 
-        return {
-            "name": tool.name,
-            "description": tool.description,
-            "category": tool.metadata.category,
-            "dangerous": tool.metadata.dangerous,
-            "parameters": [
-                {
-                    "name": p.name,
-                    "type": p.type.__name__,
-                    "description": p.description,
-                    "required": p.required,
-                    "default": p.default
-                }
-                for p in tool.metadata.parameters
-            ]
-        }
+        return tool.schema
 
     def get_all_tools_info(self) -> List[Dict[str, Any]]:
         """
@@ -380,6 +531,16 @@ def get_registry() -> ToolRegistry:
     return _global_registry
 
 
+def get_tool_classes() -> List[Type[Tool]]:
+    """
+    Get all defined tool classes
+
+    Returns:
+        Tool subclasses in definition order
+    """
+    return list(_tool_classes)
+
+
 def register_tool(tool: Tool):
     """
     Register tool in global registry
@@ -390,6 +551,16 @@ def register_tool(tool: Tool):
     _global_registry.register(tool)
 
 
+def register_tools(tools: Iterable[Tool]):
+    """
+    Register several tools in global registry
+
+    Args:
+        tools: Tools to register
+    """
+    _global_registry.register_many(tools)
+
+
 def get_tool(tool_name: str) -> Optional[Tool]:
     """
     Get tool from global registry